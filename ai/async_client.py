@@ -0,0 +1,168 @@
+"""Asyncio AI client: overlapping AI calls with in-flight and rate limits."""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Coroutine, Optional
+
+from openai import AsyncOpenAI
+
+from ai.cache import ResponseCache
+from ai.client import AI, REJECT_ANSWER, StreamedAnswer, parse_classifier_answer
+from ai.prompts import BASE_PROMPT, PROPOSAL_PROMPT
+from ai.rate_limiter import RateLimiter
+from core.config import settings
+from core.loggers import ai_logger as logger
+
+
+# Rough prompt size estimate for rate limiting, corrected by reported usage
+CHARS_PER_TOKEN = 4
+
+
+class AsyncAI:
+    """AsyncOpenAI client running on its own event loop thread.
+
+    Coroutines (`prompt_to_ai`, `evaluate_project`) can be awaited from
+    async code; sync code (the browser pipeline) passes them to `submit()`
+    and gets a concurrent Future, so the browser keeps working while
+    answers are generated. At most `max_in_flight` requests run at once
+    and requests/tokens per minute are limited. Shares the response cache
+    with `AI`.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = settings.AI_MAX_IN_FLIGHT,
+        requests_per_minute: float = settings.AI_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = settings.AI_TOKENS_PER_MINUTE,
+    ):
+        """Initialize async AI client.
+
+        Args:
+            max_in_flight: Max concurrent requests to the API
+            requests_per_minute: Max requests per minute (0 - no limit)
+            tokens_per_minute: Max tokens per minute (0 - no limit)
+        """
+        self.client = AsyncOpenAI(
+            base_url=settings.OPENROUTER_BASE_URL,
+            api_key=settings.OPENROUTER_API_KEY,
+        )
+        self.max_in_flight = max(1, max_in_flight)
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    async def prompt_to_ai(
+        self,
+        prompt: str,
+        max_tries: int = 3,
+        use_cache: bool = True,
+        stream: bool = False,
+        **overrides,
+    ) -> str | None:
+        """Get AI answer for a prompt (same contract as `AI.prompt_to_ai`)."""
+        request = AI.build_request(prompt, **overrides)
+
+        cache = AI.get_cache() if use_cache else None
+        cache_key = ResponseCache.make_key(**request) if cache else None
+        if cache:
+            result = cache.get(cache_key)
+            if result is not None:
+                logger.info(f"AI response taken from cache ({cache.stats})")
+                return result
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        estimated_tokens = len(prompt) // CHARS_PER_TOKEN + request["max_tokens"]
+
+        for _ in range(max_tries + 1):
+            async with self._semaphore:
+                await self.rate_limiter.acquire(estimated_tokens)
+                if stream:
+                    result = await self._stream_completion(request)
+                else:
+                    completion = await self.client.chat.completions.create(**request)
+                    result = completion.choices[0].message.content
+
+                    if completion.usage is not None:
+                        self.rate_limiter.correct(estimated_tokens, completion.usage.total_tokens)
+
+            if result:
+                if cache:
+                    cache.set(cache_key, result)
+                return result
+
+        logger.error(f"AI returned an empty response")
+        return None
+
+    async def _stream_completion(self, request: dict) -> str:
+        """Stream a completion, aborting it as soon as the answer starts with "false"."""
+        answer = StreamedAnswer()
+        completion = await self.client.chat.completions.create(**request, stream=True)
+
+        try:
+            async for chunk in completion:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text and answer.feed(text) is False:
+                    logger.info("AI answer starts with 'false', stream aborted")
+                    return REJECT_ANSWER
+        finally:
+            await completion.close()
+
+        return answer.text
+
+    async def evaluate_project(self, description: str) -> str | None:
+        """Get bid message for a project description (same contract as `AI.evaluate_project`)."""
+        if not settings.AI_TWO_STAGE:
+            return await self.prompt_to_ai(
+                BASE_PROMPT.format(project_description=description),
+                stream=settings.AI_STREAMING,
+            )
+
+        accepted = parse_classifier_answer(await self.prompt_to_ai(**AI.classifier_request(description)))
+        if accepted is None:
+            return None
+        if not accepted:
+            return REJECT_ANSWER
+
+        return await self.prompt_to_ai(
+            PROPOSAL_PROMPT.format(project_description=description),
+            stream=settings.AI_STREAMING,
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="async-ai", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        """Run a coroutine of this client from sync code.
+
+        Args:
+            coroutine: E.g. `async_ai.evaluate_project(description)`
+
+        Returns:
+            Future resolving to the coroutine result
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def close(self) -> None:
+        """Close HTTP client and stop the event loop thread."""
+        with self._start_lock:
+            if self._loop is None:
+                return
+
+            asyncio.run_coroutine_threadsafe(self.client.close(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+            self._semaphore = None
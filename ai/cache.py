@@ -0,0 +1,113 @@
+"""Disk-backed cache of LLM responses."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from core.config import settings
+from core.loggers import ai_logger as logger
+
+
+class ResponseCache:
+    """SQLite cache of completions keyed by request parameters.
+
+    Entries older than `ttl` seconds are ignored and deleted. When the
+    cache grows over `max_entries`, least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str = settings.AI_CACHE_PATH,
+        ttl: float = settings.AI_CACHE_TTL,
+        max_entries: int = settings.AI_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file
+            ttl: Entry lifetime (seconds)
+            max_entries: Max number of stored responses
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at)")
+
+    @staticmethod
+    def make_key(**params) -> str:
+        """Hash request parameters (model, messages, sampling settings) into a cache key."""
+        return hashlib.sha256(json.dumps(params, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get cached response, or None on miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """Store response and evict least recently used entries over the limit."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            self._connection.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss statistics of this process."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+        logger.info(f"AI response cache stats: {self.stats}")
@@ -1,13 +1,92 @@
 import json
+import re
+from typing import Callable
 from core.config import settings
 from openai import OpenAI
+from ai.cache import ResponseCache
+from ai.prompts import BASE_PROMPT, CLASSIFIER_PROMPT, PROPOSAL_PROMPT
 from core.loggers import ai_logger as logger
 
+
+# Leading word of a classifier answer; anything else ("The...", a truncated
+# word) is not recognized, so the project is retried instead of guessed
+CLASSIFIER_ACCEPT = ("yes", "true", "так")
+CLASSIFIER_REJECT = ("no", "false", "ні")
+FIRST_WORD = re.compile(r"\w+")
+
+
+def parse_classifier_answer(answer: str | None) -> bool | None:
+    """Classifier answer to True (bid) / False (skip); None if not recognized."""
+    answer = (answer or "").strip().lower()
+    match = FIRST_WORD.match(answer.lstrip('"\'*`«'))
+    word = match.group(0) if match else ""
+    if word in CLASSIFIER_ACCEPT:
+        return True
+    if word in CLASSIFIER_REJECT:
+        return False
+    if answer:
+        logger.warning(f"Unrecognized classifier answer: {answer!r}")
+    return None
+
+
+# Whole answer of BASE_PROMPT when the project is not worth a bid
+REJECT_ANSWER = "false"
+
+
+class StreamedAnswer:
+    """Accumulates a streamed answer and decides on its first tokens.
+
+    `verdict` becomes False as soon as the answer starts with "false" and
+    True as soon as it can't be "false" anymore; None while undecided.
+    """
+
+    def __init__(self):
+        self.parts: list[str] = []
+        self.verdict: bool | None = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def feed(self, text: str) -> bool | None:
+        """Add streamed text and return the verdict so far."""
+        self.parts.append(text)
+        if self.verdict is None:
+            head = self.text.lstrip().lstrip('"\'').lower()
+            if head.startswith(REJECT_ANSWER):
+                self.verdict = False
+            elif head and not REJECT_ANSWER.startswith(head):
+                self.verdict = True
+        return self.verdict
+
+
 class AI:
+    _cache: ResponseCache | None = None
+
+    @classmethod
+    def get_cache(cls) -> ResponseCache | None:
+        """Get response cache (None if AI_CACHE_ENABLED is off)."""
+        if cls._cache is None and settings.AI_CACHE_ENABLED:
+            cls._cache = ResponseCache()
+        return cls._cache
+
+    @classmethod
+    def close_cache(cls) -> None:
+        if cls._cache is not None:
+            cls._cache.close()
+            cls._cache = None
+
     @classmethod
-    def prompt_to_ai(cls, prompt: str, max_tries: int = 3) -> str | None:
-        completion = settings.client.chat.completions.create(
-            model=settings.OPENROUTER_AI_MODEL,
+    def build_request(
+        cls,
+        prompt: str,
+        model: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> dict:
+        """Chat completion parameters for a prompt (generation settings by default)."""
+        return dict(
+            model=model or settings.OPENROUTER_AI_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -18,21 +97,124 @@ class AI:
                     "content": prompt
                 }
             ],
-            temperature=settings.AI_TEMPERATURE,
+            temperature=settings.AI_TEMPERATURE if temperature is None else temperature,
             top_p=settings.AI_TOP_P,
-            max_tokens=settings.AI_MAX_TOKENS,
-
+            max_tokens=max_tokens or settings.AI_MAX_TOKENS,
         )
-        result = completion.choices[0].message.content
+
+    @classmethod
+    def prompt_to_ai(
+        cls,
+        prompt: str,
+        max_tries: int = 3,
+        use_cache: bool = True,
+        stream: bool = False,
+        on_accept: Callable[[], None] | None = None,
+        **overrides,
+    ) -> str | None:
+        request = cls.build_request(prompt, **overrides)
+
+        # Same request was answered before - no API call
+        cache = cls.get_cache() if use_cache else None
+        cache_key = ResponseCache.make_key(**request) if cache else None
+        if cache:
+            result = cache.get(cache_key)
+            if result is not None:
+                logger.info(f"AI response taken from cache ({cache.stats})")
+                return result
+
+        if stream:
+            result = cls._stream_completion(request, on_accept)
+        else:
+            completion = settings.client.chat.completions.create(**request)
+            result = completion.choices[0].message.content
 
         if not result:
             if max_tries > 0:
-                return cls.prompt_to_ai(prompt, max_tries - 1)
+                return cls.prompt_to_ai(prompt, max_tries - 1, use_cache, stream, on_accept, **overrides)
             else:
                 logger.error(f"AI returned an empty response")
                 return None
 
+        if cache:
+            cache.set(cache_key, result)
+
         return result
 
+    @classmethod
+    def _stream_completion(cls, request: dict, on_accept: Callable[[], None] | None = None) -> str:
+        """Stream a completion, aborting it as soon as the answer starts with "false".
+
+        Args:
+            request: Chat completion parameters
+            on_accept: Called once when the answer turns out not to be "false",
+                while the rest of it is still streaming
+
+        Returns:
+            "false" for aborted answers, otherwise the whole answer
+        """
+        answer = StreamedAnswer()
+        completion = settings.client.chat.completions.create(**request, stream=True)
+
+        try:
+            for chunk in completion:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if not text:
+                    continue
+
+                decided = answer.verdict is not None
+                verdict = answer.feed(text)
+                if verdict is False:
+                    logger.info("AI answer starts with 'false', stream aborted")
+                    return REJECT_ANSWER
+                if verdict and not decided and on_accept is not None:
+                    on_accept()
+        finally:
+            completion.close()
+
+        return answer.text
 
-    
\ No newline at end of file
+    @classmethod
+    def classifier_request(cls, description: str) -> dict:
+        """Request parameters of the classifier stage."""
+        return dict(
+            prompt=CLASSIFIER_PROMPT.format(project_description=description),
+            model=settings.AI_CLASSIFIER_MODEL,
+            max_tokens=settings.AI_CLASSIFIER_MAX_TOKENS,
+            temperature=0,
+        )
+
+    @classmethod
+    def evaluate_project(cls, description: str, on_accept: Callable[[], None] | None = None) -> str | None:
+        """Get bid message for a project description.
+
+        One BASE_PROMPT call, or with AI_TWO_STAGE a cheap classifier call
+        followed by proposal generation only for accepted projects. With
+        AI_STREAMING the answer is streamed: rejections are cut short and
+        `on_accept` runs while the accepted message is still generated.
+
+        Args:
+            description: Project description
+            on_accept: Called once the project is known to be accepted (streaming only)
+
+        Returns:
+            Bid message, "false" if AI decided not to bid, None if AI didn't answer
+        """
+        if not settings.AI_TWO_STAGE:
+            return cls.prompt_to_ai(
+                BASE_PROMPT.format(project_description=description),
+                stream=settings.AI_STREAMING,
+                on_accept=on_accept,
+            )
+
+        accepted = parse_classifier_answer(cls.prompt_to_ai(**cls.classifier_request(description)))
+        if accepted is None:
+            return None
+        if not accepted:
+            return REJECT_ANSWER
+
+        return cls.prompt_to_ai(
+            PROPOSAL_PROMPT.format(project_description=description),
+            stream=settings.AI_STREAMING,
+            on_accept=on_accept,
+        )
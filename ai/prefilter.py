@@ -0,0 +1,75 @@
+"""Keyword pre-filter: rejects obvious mismatches before calling AI."""
+import re
+from typing import Iterable, Optional
+
+from core.config import settings
+
+
+def compile_keywords(keywords: Iterable[str]) -> Optional[re.Pattern]:
+    """Compile keywords into one case-insensitive alternation (None if empty).
+
+    Keywords match at a word start, so inflected forms match too
+    ("вордпрес" matches "вордпресі"). Longer keywords are tried first.
+    """
+    keywords = sorted({keyword.strip().lower() for keyword in keywords if keyword.strip()}, key=len, reverse=True)
+    if not keywords:
+        return None
+    return re.compile(r"(?<!\w)(?:" + "|".join(re.escape(keyword) for keyword in keywords) + ")", re.IGNORECASE)
+
+
+class KeywordPreFilter:
+    """Decides on projects that AI would reject anyway, without an API call.
+
+    A project is rejected if its title or description mentions an exclude
+    keyword, or if include keywords are configured and none is mentioned.
+    """
+
+    def __init__(
+        self,
+        exclude: Iterable[str] = settings.AI_PREFILTER_EXCLUDE,
+        include: Iterable[str] = settings.AI_PREFILTER_INCLUDE,
+    ):
+        """Initialize pre-filter.
+
+        Args:
+            exclude: Keywords that reject a project
+            include: Keywords of which at least one is required (empty - no requirement)
+        """
+        self.exclude = compile_keywords(exclude)
+        self.include = compile_keywords(include)
+        self.checked = 0
+        self.rejected = 0
+
+    def check(self, title: str, description: str) -> Optional[str]:
+        """Check a project.
+
+        Args:
+            title: Project title
+            description: Project description
+
+        Returns:
+            Rejection reason, or None if the project should go to AI
+        """
+        self.checked += 1
+        text = f"{title}\n{description}"
+
+        if self.exclude is not None:
+            match = self.exclude.search(text)
+            if match:
+                self.rejected += 1
+                return f"excluded keyword {match.group(0)!r}"
+
+        if self.include is not None and not self.include.search(text):
+            self.rejected += 1
+            return "no included keyword"
+
+        return None
+
+    @property
+    def stats(self) -> dict:
+        """Check statistics; every rejection is one AI call saved."""
+        return {
+            "checked": self.checked,
+            "rejected": self.rejected,
+            "ai_calls_saved": self.rejected,
+        }
@@ -31,3 +31,50 @@ I will provide you only the **project description**.
 Project description:
 {project_description}
 """
+
+
+# Two-stage mode (AI_TWO_STAGE): a cheap classifier decides, then the
+# proposal is generated only for accepted projects
+
+CLASSIFIER_PROMPT = """
+Decide if our web agency should apply to a freelance project.
+We build custom websites and web applications (Next.js, React, TailwindCSS, Python, FastAPI, Flask, PostgreSQL) and Telegram bots (aiogram, React mini apps).
+
+Answer "yes" only if the project is about:
+- creating a new website (custom, not CMS/builders), OR
+- creating a new Telegram bot, OR
+- modifying/editing an existing project built with Next.js, React, Vite, FastAPI, Flask, or a Telegram bot built with aiogram.
+
+Answer "no" if the project mentions WordPress or any website builder (e.g. Wix, Squarespace, Shopify, Tilda, Webflow, OpenCart etc.), or is about anything else.
+
+Answer with exactly one word: yes or no.
+
+Project description:
+{project_description}
+"""
+
+PROPOSAL_PROMPT = """
+You will write an application message for a freelance project on my behalf.  
+I will provide you only the **project description**.
+
+### About our agency:
+- Name: Netly  
+- Focus: creating websites and web applications
+- Tech stack: Next.js, React, TailwindCSS, Python, FastAPI, Flask, PostgreSQL  
+- We do full frontend, backend, API integrations, admin panels, and Telegram bots (Python + React for mini apps, aiogram for bots)
+- Website: https://netly-agency.com 
+- Hourly rate: $10/hour (if requested)
+
+### Task:
+Generate a **professional and concise application message** for the client.  
+   - Use information about our agency and tech stack.  
+   - The **message must be in Ukrainian**.  
+   - Be structured, clear, and without fluff.  
+   - Do NOT use markup, bold, bullet points formatting, or placeholders like [your name].  
+   - Do NOT include formal sign-offs or extra details about Docker/AWS unless specifically relevant.  
+   - At the end, add only: 
+     "Наш сайт: https://netly-agency.com\nБуду радий обговорити деталі."
+
+Project description:
+{project_description}
+"""
@@ -0,0 +1,67 @@
+"""Requests/tokens per minute rate limiting for AI calls."""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `per_minute / 60` tokens per second."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.tokens = per_minute
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 - available now)."""
+        self._refill()
+        # A request bigger than the bucket waits for a full bucket
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+    def take(self, amount: float) -> None:
+        """Take tokens (may go negative after usage correction)."""
+        self._refill()
+        self.tokens -= amount
+
+
+class RateLimiter:
+    """Limits AI requests per minute and tokens per minute (0 - no limit)."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Max requests per minute
+            tokens_per_minute: Max prompt + completion tokens per minute
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until one request with `estimated_tokens` tokens fits into both limits."""
+        async with self._lock:
+            while True:
+                wait = max(
+                    self.requests.wait_time(1) if self.requests else 0.0,
+                    self.tokens.wait_time(estimated_tokens) if self.tokens else 0.0,
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self.requests:
+                self.requests.take(1)
+            if self.tokens:
+                self.tokens.take(estimated_tokens)
+
+    def correct(self, estimated_tokens: int, used_tokens: int) -> None:
+        """Account for the real token usage reported by the API."""
+        if self.tokens:
+            self.tokens.take(used_tokens - estimated_tokens)
@@ -0,0 +1,31 @@
+"""crawl state (incremental crawl watermark)
+
+Revision ID: 3b7e2c9d41a5
+Revises: deda33dc935b
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2c9d41a5'
+down_revision: Union[str, None] = 'deda33dc935b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('crawl_state',
+    sa.Column('marketplace', sa.String(length=32), nullable=False),
+    sa.Column('last_seen_link', sa.String(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('marketplace')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('crawl_state')
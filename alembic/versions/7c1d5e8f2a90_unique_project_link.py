@@ -0,0 +1,34 @@
+"""unique index on projects.link
+
+Revision ID: 7c1d5e8f2a90
+Revises: 3b7e2c9d41a5
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d5e8f2a90'
+down_revision: Union[str, None] = '3b7e2c9d41a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Видаляємо дублікати (залишаємо найстаріший запис), інакше унікальний індекс не створиться
+    op.execute("""
+        DELETE FROM projects
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM projects GROUP BY link
+        )
+    """)
+
+    op.create_index(op.f('ix_projects_link'), 'projects', ['link'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_projects_link'), table_name='projects')
@@ -0,0 +1,35 @@
+"""partial index on active projects
+
+Revision ID: a4f9c2b7d613
+Revises: 7c1d5e8f2a90
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f9c2b7d613'
+down_revision: Union[str, None] = '7c1d5e8f2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Індексуємо лише активні проєкти (без ставки і не пропущені).
+    # Умова має збігатися з тим, як SQLAlchemy рендерить фільтр у запитах
+    op.create_index(
+        'ix_projects_active',
+        'projects',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("NOT is_bid_placed AND NOT is_bid_skipped"),
+        sqlite_where=sa.text("is_bid_placed = 0 AND is_bid_skipped = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_active', table_name='projects')
@@ -0,0 +1,89 @@
+"""project status lifecycle and timestamps
+
+Revision ID: c81f4a6d2e37
+Revises: a4f9c2b7d613
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4a6d2e37'
+down_revision: Union[str, None] = 'a4f9c2b7d613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PROJECT_STATUSES = ('new', 'details_fetched', 'ai_pending', 'ai_rejected', 'bid_failed', 'bid_placed', 'skipped')
+ACTIVE_CONDITION = "status IN ('new', 'details_fetched', 'ai_pending', 'bid_failed')"
+
+
+def upgrade() -> None:
+    project_status = sa.Enum(*PROJECT_STATUSES, name='project_status')
+    project_status.create(op.get_bind(), checkfirst=True)
+
+    # Старий частковий індекс посилається на булеві поля, які видаляються нижче
+    op.drop_index('ix_projects_active', table_name='projects')
+
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.add_column(sa.Column('status', project_status, nullable=True))
+        batch_op.add_column(sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()))
+        batch_op.add_column(sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Переносимо дані з булевих полів: ставка > пропущено > новий
+    op.execute("UPDATE projects SET status = 'bid_placed' WHERE is_bid_placed")
+    op.execute("UPDATE projects SET status = 'skipped' WHERE status IS NULL AND is_bid_skipped")
+    op.execute("UPDATE projects SET status = 'new' WHERE status IS NULL")
+
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.alter_column('status', existing_type=project_status, nullable=False)
+        batch_op.drop_column('is_bid_placed')
+        batch_op.drop_column('is_bid_skipped')
+
+    op.create_index(op.f('ix_projects_status'), 'projects', ['status'], unique=False)
+    # Частковий індекс черги: лише активні проєкти, next_attempt_at - для фільтра повторних спроб
+    op.create_index(
+        'ix_projects_queue',
+        'projects',
+        ['id', 'next_attempt_at'],
+        unique=False,
+        postgresql_where=sa.text(ACTIVE_CONDITION),
+        sqlite_where=sa.text(ACTIVE_CONDITION),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_queue', table_name='projects')
+    op.drop_index(op.f('ix_projects_status'), table_name='projects')
+
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.add_column(sa.Column('is_bid_placed', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.add_column(sa.Column('is_bid_skipped', sa.Boolean(), nullable=False, server_default=sa.false()))
+
+    # AI_REJECTED і вичерпані спроби раніше позначались як пропущені
+    op.execute("UPDATE projects SET is_bid_placed = TRUE WHERE status = 'bid_placed'")
+    op.execute("UPDATE projects SET is_bid_skipped = TRUE WHERE status IN ('skipped', 'ai_rejected')")
+
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_column('next_attempt_at')
+        batch_op.drop_column('processed_at')
+        batch_op.drop_column('created_at')
+        batch_op.drop_column('attempts')
+        batch_op.drop_column('status')
+
+    sa.Enum(*PROJECT_STATUSES, name='project_status').drop(op.get_bind(), checkfirst=True)
+
+    op.create_index(
+        'ix_projects_active',
+        'projects',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("NOT is_bid_placed AND NOT is_bid_skipped"),
+        sqlite_where=sa.text("is_bid_placed = 0 AND is_bid_skipped = 0"),
+    )
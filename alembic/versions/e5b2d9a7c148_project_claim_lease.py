@@ -0,0 +1,30 @@
+"""project claim lease for multiple workers
+
+Revision ID: e5b2d9a7c148
+Revises: c81f4a6d2e37
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2d9a7c148'
+down_revision: Union[str, None] = 'c81f4a6d2e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Хто з воркерів взяв проєкт і до якого часу (після - оренда вважається простроченою)
+    op.add_column('projects', sa.Column('claimed_by', sa.String(), nullable=True))
+    op.add_column('projects', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_column('lease_expires_at')
+        batch_op.drop_column('claimed_by')
@@ -0,0 +1,34 @@
+"""project description, content hash and AI verdict
+
+Revision ID: f3a6c1e8b254
+Revises: e5b2d9a7c148
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a6c1e8b254'
+down_revision: Union[str, None] = 'e5b2d9a7c148'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Очищений опис, його sha256 і вердикт AI - щоб не оцінювати той самий опис повторно
+    op.add_column('projects', sa.Column('description', sa.Text(), nullable=True))
+    op.add_column('projects', sa.Column('description_hash', sa.String(length=64), nullable=True))
+    op.add_column('projects', sa.Column('ai_verdict', sa.String(length=16), nullable=True))
+    op.create_index(op.f('ix_projects_description_hash'), 'projects', ['description_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_projects_description_hash'), table_name='projects')
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_column('ai_verdict')
+        batch_op.drop_column('description_hash')
+        batch_op.drop_column('description')
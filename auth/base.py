@@ -2,9 +2,12 @@
 import time
 from abc import ABC, abstractmethod
 from typing import Optional, Callable
+from urllib.parse import urlsplit
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
 
 from auth.selectors import LoginPageSelectorsFactory, MFASelectorsFactory
+from auth.session_store import SessionStore
 from core.exceptions import (
     LoginFailedError,
     MFARequiredError,
@@ -12,12 +15,14 @@ from core.exceptions import (
 )
 from core.browser import Browser
 from core.loggers import login_logger as logger
+from schemas.project import MarketplaceEnum
 
 
 class AuthenticatorFactory(ABC):
     """Base authenticator with common authentication logic."""
     
     # Class attributes - override in subclasses
+    MARKETPLACE: MarketplaceEnum
     REQUIRES_MFA: bool = True
     LOGIN_SELECTORS: LoginPageSelectorsFactory
     MFA_SELECTORS: Optional[MFASelectorsFactory]
@@ -31,6 +36,7 @@ class AuthenticatorFactory(ABC):
         """
         self.browser = browser
         self.mfa_callback = mfa_callback
+        self.session_store = SessionStore.from_settings()
     
     @property
     def requires_mfa(self) -> bool:
@@ -188,9 +194,102 @@ class AuthenticatorFactory(ABC):
         except Exception:
             pass
     
+    def get_probe_url(self) -> str:
+        """Get page used to check the session: marketplace home page.
+        
+        Override to probe a private page instead.
+        """
+        login_url = urlsplit(self.get_login_url())
+        return f"{login_url.scheme}://{login_url.netloc}/"
+    
+    def is_authenticated(self, timeout: float = 10) -> bool:
+        """Probe whether the browser session is logged in.
+        
+        Looks for LOGGED_IN_MARKER, so a slow, broken or captcha page
+        counts as logged out rather than logged in.
+        
+        Args:
+            timeout: Seconds to wait for the marker
+            
+        Returns:
+            True if session is authenticated
+        """
+        self.browser.driver.get(self.get_probe_url())
+        try:
+            WebDriverWait(self.browser.driver, timeout).until(
+                lambda driver: driver.find_elements(*self.LOGIN_SELECTORS.LOGGED_IN_MARKER)
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def restore_session(self) -> bool:
+        """Restore saved session into the browser and verify it.
+        
+        Returns:
+            True if saved session was restored and is still authenticated
+        """
+        if self.session_store is None:
+            return False
+        
+        state = self.session_store.load(self.MARKETPLACE)
+        if not state:
+            return False
+        
+        try:
+            logger.info(f"Restoring saved session from {state.get('saved_at')}")
+            self.browser.import_cookies(state["cookies"], state["url"])
+            if state.get("local_storage"):
+                self.browser.import_local_storage(state["local_storage"])
+            
+            if self.is_authenticated():
+                logger.info("Saved session is valid, login skipped")
+                return True
+        except Exception as e:
+            logger.warning(f"Failed to restore saved session: {e}")
+        
+        logger.info("Saved session expired, logging in with credentials")
+        self.session_store.clear(self.MARKETPLACE)
+        self.browser.driver.delete_all_cookies()
+        return False
+    
+    def relogin(self) -> bool:
+        """Drop the current session and log in with credentials again.
+        
+        Returns:
+            True if login successful
+            
+        Raises:
+            LoginFailedError: If login fails
+        """
+        logger.info(f"Logging in to {self.MARKETPLACE.value} again")
+        if self.session_store is not None:
+            self.session_store.clear(self.MARKETPLACE)
+        self.browser.driver.delete_all_cookies()
+        return self.login()
+    
+    def save_session(self) -> None:
+        """Save current browser session (cookies and local storage)."""
+        if self.session_store is None:
+            return
+        
+        try:
+            current_url = urlsplit(self.browser.driver.current_url)
+            self.session_store.save(
+                self.MARKETPLACE,
+                url=f"{current_url.scheme}://{current_url.netloc}/",
+                cookies=self.browser.export_cookies(),
+                local_storage=self.browser.export_local_storage()
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save session: {e}")
+    
     def login(self) -> bool:
         """Perform login with credentials and optional MFA.
         
+        A valid saved session (see SessionStore) is restored instead,
+        and a successful login is saved for the next start.
+        
         Returns:
             True if login successful
             
@@ -199,6 +298,9 @@ class AuthenticatorFactory(ABC):
             InvalidCredentialsError: If credentials are invalid
             MFARequiredError: If MFA cannot be completed
         """
+        if self.restore_session():
+            return True
+        
         try:
             # Get credentials
             email, password = self.get_credentials()
@@ -247,6 +349,7 @@ class AuthenticatorFactory(ABC):
             
             if mfa_success:
                 logger.info("Login successful")
+                self.save_session()
                 return True
             else:
                 logger.error("Login failed - MFA not completed")
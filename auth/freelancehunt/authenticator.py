@@ -2,6 +2,7 @@
 from core.config import settings
 from core.browser import Browser
 from auth.base import AuthenticatorFactory
+from schemas.project import MarketplaceEnum
 from auth.freelancehunt.selectors import LoginPageSelectors, MFASelectors
 
 
@@ -9,6 +10,7 @@ class FreelanceHuntAuthenticator(AuthenticatorFactory):
     """Freelancehunt authenticator."""
     
     # Class attributes
+    MARKETPLACE = MarketplaceEnum.FREELANCEHUNT
     REQUIRES_MFA = True
     LOGIN_SELECTORS = LoginPageSelectors
     MFA_SELECTORS = MFASelectors
@@ -4,6 +4,7 @@ class LoginPageSelectors:
     EMAIL_INPUT = (By.CSS_SELECTOR, "input[type='text'].form-control")
     PASSWORD_INPUT = (By.CSS_SELECTOR, "input[type='password'].form-control")
     LOGIN_BUTTON = (By.CSS_SELECTOR, "button.btn-auth")
+    LOGGED_IN_MARKER = (By.CSS_SELECTOR, "a[href*='/logout']")
 
 class MFASelectors:
     MFA_INPUT = (By.CLASS_NAME, "form-control")
@@ -2,6 +2,7 @@
 from core.config import settings
 from core.browser import Browser
 from auth.base import AuthenticatorFactory
+from schemas.project import MarketplaceEnum
 from auth.freelancer.selectors import LoginPageSelectors
 
 
@@ -9,6 +10,7 @@ class FreelancerAuthenticator(AuthenticatorFactory):
     """Freelancer.com authenticator."""
     
     # Class attributes
+    MARKETPLACE = MarketplaceEnum.FREELANCER
     REQUIRES_MFA = False
     LOGIN_SELECTORS = LoginPageSelectors
     MFA_SELECTORS = None
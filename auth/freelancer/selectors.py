@@ -4,4 +4,5 @@ class LoginPageSelectors:
     EMAIL_INPUT = (By.ID, "emailOrUsernameInput")
     PASSWORD_INPUT = (By.ID, "passwordInput")
     LOGIN_BUTTON = (By.XPATH, "//button[normalize-space(text())='Log in']")
+    LOGGED_IN_MARKER = (By.CSS_SELECTOR, "fl-user-avatar, a[href*='/logout']")
 
@@ -5,6 +5,8 @@ class LoginPageSelectorsFactory(ABC):
     EMAIL_INPUT: tuple[By, str]
     PASSWORD_INPUT: tuple[By, str]
     LOGIN_BUTTON: tuple[By, str]
+    # Present only for logged in users (user menu, avatar, logout link)
+    LOGGED_IN_MARKER: tuple[By, str]
 
 class MFASelectorsFactory(ABC):
     MFA_INPUT: tuple[By, str]
@@ -0,0 +1,88 @@
+"""Encrypted on-disk storage of authenticated browser sessions."""
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from core.config import settings
+from core.loggers import login_logger as logger
+from schemas.project import MarketplaceEnum
+
+
+class SessionStore:
+    """Stores cookies and local storage per marketplace in Fernet-encrypted files."""
+
+    def __init__(self, directory: Path, key: str):
+        """Initialize session store.
+
+        Args:
+            directory: Directory for session files
+            key: Fernet key (generate with `Fernet.generate_key()`)
+        """
+        self.directory = Path(directory)
+        self.fernet = Fernet(key)
+
+    @classmethod
+    def from_settings(cls) -> Optional["SessionStore"]:
+        """Create store from settings, or None if no encryption key is configured."""
+        if not settings.SESSION_ENCRYPTION_KEY:
+            return None
+
+        try:
+            return cls(Path(settings.SESSION_STORE_DIR), settings.SESSION_ENCRYPTION_KEY)
+        except ValueError as e:
+            logger.error(f"Invalid SESSION_ENCRYPTION_KEY, session store disabled: {e}")
+            return None
+
+    def _path(self, marketplace: MarketplaceEnum) -> Path:
+        return self.directory / f"{marketplace.value}.session"
+
+    def save(self, marketplace: MarketplaceEnum, url: str, cookies: list[dict], local_storage: dict[str, str]) -> None:
+        """Encrypt and save session state.
+
+        Args:
+            marketplace: Marketplace the session belongs to
+            url: Origin the cookies and local storage belong to
+            cookies: Cookies in WebDriver format
+            local_storage: localStorage items
+        """
+        state = {
+            "url": url,
+            "cookies": cookies,
+            "local_storage": local_storage,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+        }
+        token = self.fernet.encrypt(json.dumps(state).encode("utf-8"))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(marketplace)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(token)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+
+        logger.info(f"Saved {marketplace.value} session ({len(cookies)} cookies)")
+
+    def load(self, marketplace: MarketplaceEnum) -> Optional[dict]:
+        """Load and decrypt session state.
+
+        Returns:
+            Dict with "url", "cookies", "local_storage" and "saved_at" keys,
+            or None if there is no valid saved session
+        """
+        path = self._path(marketplace)
+        if not path.exists():
+            return None
+
+        try:
+            return json.loads(self.fernet.decrypt(path.read_bytes()))
+        except (InvalidToken, ValueError) as e:
+            logger.warning(f"Saved {marketplace.value} session is unreadable, ignoring: {e}")
+            return None
+
+    def clear(self, marketplace: MarketplaceEnum) -> None:
+        """Delete saved session."""
+        self._path(marketplace).unlink(missing_ok=True)
@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from typing import Iterator
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -8,9 +11,33 @@ from selenium.webdriver.remote.webelement import WebElement
 from core.config import settings
 from core.loggers import browser_logger as logger
 
+# URL patterns blocked by CDP in lean mode
+LEAN_BLOCKED_RESOURCES = [
+    # images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif",
+    # fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # media
+    "*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav",
+]
+LEAN_BLOCKED_TRACKERS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*",
+    "*mc.yandex.ru*", "*clarity.ms*",
+]
+LEAN_BLOCKED_STYLES = ["*.css"]
+
+# Max wait for DOMContentLoaded of a lean "eager" navigation (sec)
+LEAN_PAGE_LOAD_TIMEOUT = 30
+
+
 class Browser:
     def __init__(self):
         self.driver = webdriver.Chrome(service=self.get_service(), options=self.get_options())
+        self._lean_active = False
+        self._network_enabled = False
+        # Whether the page last opened with open() was loaded inside lean()
+        self.lean_page = False
 
 
     def get_service(self) -> Service:
@@ -24,9 +51,149 @@ class Browser:
             options.add_argument("--headless=new")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
+
+        if settings.BROWSER_LEAN_MODE:
+            # Page load strategy is applied per navigation in open(), not session-wide
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-component-update")
+            options.add_argument("--disable-default-apps")
+            options.add_argument("--disable-sync")
+            options.add_argument("--metrics-recording-only")
+            options.add_argument("--no-first-run")
             
         return options
 
+    @staticmethod
+    def get_lean_blocked_urls() -> list[str]:
+        """Get URL patterns blocked while in lean mode."""
+        urls = LEAN_BLOCKED_RESOURCES + LEAN_BLOCKED_TRACKERS
+        if settings.BROWSER_LEAN_BLOCK_CSS:
+            urls += LEAN_BLOCKED_STYLES
+        return urls
+
+    def _set_url_blocking(self, urls: list[str]) -> None:
+        if not self._network_enabled:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self._network_enabled = True
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+
+    @contextmanager
+    def lean(self) -> Iterator["Browser"]:
+        """Block images, fonts, media and trackers for pages loaded inside the block.
+
+        No-op if BROWSER_LEAN_MODE is disabled. Use for read-only page loads;
+        login and bidding keep full pages. Navigate with `open()` to also apply
+        BROWSER_PAGE_LOAD_STRATEGY.
+        """
+        if not settings.BROWSER_LEAN_MODE or self._lean_active:
+            yield self
+            return
+
+        try:
+            self._set_url_blocking(self.get_lean_blocked_urls())
+            self._lean_active = True
+        except Exception as e:
+            logger.warning(f"Failed to enable lean mode: {e}")
+            yield self
+            return
+
+        try:
+            yield self
+        finally:
+            self._lean_active = False
+            try:
+                self._set_url_blocking([])
+            except Exception as e:
+                logger.warning(f"Failed to disable lean mode: {e}")
+
+    def open(self, url: str) -> None:
+        """Navigate to url.
+
+        Inside lean() the page loads with BROWSER_PAGE_LOAD_STRATEGY: "eager"
+        returns at DOMContentLoaded, "none" right after navigation starts.
+        The driver itself keeps the normal strategy, so other pages (login,
+        bidding) load fully.
+        """
+        strategy = settings.BROWSER_PAGE_LOAD_STRATEGY if self._lean_active else "normal"
+
+        if strategy == "normal":
+            self.driver.get(url)
+        else:
+            self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+            if strategy == "eager":
+                WebDriverWait(self.driver, LEAN_PAGE_LOAD_TIMEOUT).until(
+                    lambda driver: driver.execute_script("return document.readyState") != "loading"
+                )
+
+        self.lean_page = self._lean_active
+
+    def export_cookies(self) -> list[dict]:
+        """Get cookies of the current session (WebDriver format)."""
+        return self.driver.get_cookies()
+
+    def import_cookies(self, cookies: list[dict], url: str) -> None:
+        """Open url and add session cookies to it, then reload.
+
+        Args:
+            cookies: Cookies in WebDriver format
+            url: Page on the cookies domain (WebDriver can only set cookies for the current domain)
+        """
+        self.driver.get(url)
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                logger.warning(f"Failed to add cookie {cookie.get('name')}: {e}")
+        self.driver.refresh()
+
+    def export_local_storage(self) -> dict[str, str]:
+        """Get localStorage items of the current page origin."""
+        return self.driver.execute_script(
+            "const items = {};"
+            "for (let i = 0; i < localStorage.length; i++) {"
+            "  const key = localStorage.key(i); items[key] = localStorage.getItem(key);"
+            "}"
+            "return items;"
+        ) or {}
+
+    def import_local_storage(self, items: dict[str, str]) -> None:
+        """Set localStorage items on the current page origin."""
+        self.driver.execute_script(
+            "for (const [key, value] of Object.entries(arguments[0])) {"
+            "  localStorage.setItem(key, value);"
+            "}",
+            items
+        )
+
+    def memory_usage_mb(self) -> float | None:
+        """Get resident memory of chromedriver and all Chrome processes it started.
+
+        Returns:
+            RSS in MB, or None if psutil is not installed or process is unknown
+        """
+        try:
+            import psutil
+        except ImportError:
+            return None
+
+        process = getattr(self.driver.service, "process", None) if self.driver else None
+        if process is None:
+            return None
+
+        try:
+            root = psutil.Process(process.pid)
+            processes = [root, *root.children(recursive=True)]
+            rss = 0
+            for proc in processes:
+                try:
+                    rss += proc.memory_info().rss
+                except psutil.Error:
+                    continue
+            return rss / (1024 * 1024)
+        except psutil.Error:
+            return None
+
     def close_driver(self) -> None:
         if self.driver is not None:
             self.driver.quit()
@@ -0,0 +1,161 @@
+"""Pool of browsers sharing one authenticated session."""
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit
+
+from core.browser import Browser
+from core.config import settings
+from core.loggers import browser_logger as logger
+
+
+class BrowserPool:
+    """Fixed-size pool of Browser instances for parallel project processing.
+
+    Log in once with any browser, then `start()` replicates its cookies into
+    every pooled driver. Drivers are recycled after `max_uses` checkouts or
+    when their memory exceeds `max_memory_mb` (requires psutil).
+
+    The pool never shrinks: if a replacement browser fails to start, a
+    working browser is kept until the next recycling, and a slot whose
+    browser died is restarted at its next checkout, which raises if Chrome
+    still can't start.
+    """
+
+    def __init__(
+        self,
+        size: int = settings.BROWSER_POOL_SIZE,
+        max_uses: int = settings.BROWSER_POOL_MAX_USES,
+        max_memory_mb: int = settings.BROWSER_POOL_MAX_MEMORY_MB,
+        browser_factory: Callable[[], Browser] = Browser,
+    ):
+        """Initialize browser pool.
+
+        Args:
+            size: Number of browsers in pool
+            max_uses: Recycle a browser after this many checkouts (0 - never)
+            max_memory_mb: Recycle a browser whose RSS exceeds this (0 - no limit)
+            browser_factory: Creates a new Browser
+        """
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self.browser_factory = browser_factory
+
+        # None marks a slot whose browser has to be started at checkout
+        self._available: queue.Queue[Optional[Browser]] = queue.Queue()
+        self._browsers: list[Browser] = []
+        self._uses: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+        self._cookies: list[dict] = []
+        self._session_url: Optional[str] = None
+
+    def start(self, authenticated_browser: Browser) -> None:
+        """Create pooled browsers with the session of an already logged in browser.
+
+        Args:
+            authenticated_browser: Browser after successful login
+        """
+        self._cookies = authenticated_browser.export_cookies()
+        current_url = urlsplit(authenticated_browser.driver.current_url)
+        self._session_url = f"{current_url.scheme}://{current_url.netloc}/"
+
+        logger.info(f"Starting browser pool: {self.size} browsers, {len(self._cookies)} session cookies")
+        for _ in range(self.size):
+            browser = self._create_browser()
+            self._available.put(browser)
+
+    def _create_browser(self) -> Browser:
+        browser = self.browser_factory()
+        browser.import_cookies(self._cookies, self._session_url)
+        with self._lock:
+            self._browsers.append(browser)
+            self._uses[id(browser)] = 0
+        return browser
+
+    def _retire_browser(self, browser: Browser) -> None:
+        with self._lock:
+            if browser in self._browsers:
+                self._browsers.remove(browser)
+            self._uses.pop(id(browser), None)
+        browser.close_driver()
+
+    def _needs_recycling(self, browser: Browser) -> bool:
+        uses = self._uses.get(id(browser), 0)
+        if self.max_uses and uses >= self.max_uses:
+            logger.info(f"Recycling browser after {uses} uses")
+            return True
+
+        if self.max_memory_mb:
+            memory_mb = browser.memory_usage_mb()
+            if memory_mb is not None and memory_mb > self.max_memory_mb:
+                logger.info(f"Recycling browser using {memory_mb:.0f} MB (limit {self.max_memory_mb} MB)")
+                return True
+
+        return False
+
+    def _replace_browser(self, browser: Browser) -> Optional[Browser]:
+        """Recycle a checked in browser.
+
+        Returns:
+            New browser; the old one if it still works and no new one could
+            be started; None if the slot has to be restarted at checkout
+        """
+        try:
+            replacement = self._create_browser()
+        except Exception as e:
+            if browser.driver is not None:
+                logger.warning(f"Failed to recreate pooled browser, keeping the old one: {e}")
+                return browser
+            logger.error(f"Failed to recreate pooled browser, retrying at next checkout: {e}", exc_info=True)
+            self._retire_browser(browser)
+            return None
+
+        self._retire_browser(browser)
+        return replacement
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[Browser]:
+        """Check out a browser for exclusive use.
+
+        Args:
+            timeout: Seconds to wait for a free browser (None - wait forever)
+
+        Raises:
+            queue.Empty: If no browser became free within timeout
+            Exception: If the browser of a lost slot can't be started
+        """
+        browser = self._available.get(timeout=timeout)
+        if browser is None:
+            try:
+                browser = self._create_browser()
+            except Exception:
+                # Keep the slot, so the next checkout tries again
+                self._available.put(None)
+                raise
+
+        try:
+            yield browser
+        finally:
+            with self._lock:
+                self._uses[id(browser)] = self._uses.get(id(browser), 0) + 1
+
+            if browser.driver is None or self._needs_recycling(browser):
+                browser = self._replace_browser(browser)
+
+            self._available.put(browser)
+
+    def close(self) -> None:
+        """Quit all pooled browsers."""
+        with self._lock:
+            browsers = list(self._browsers)
+            self._browsers.clear()
+            self._uses.clear()
+
+        for browser in browsers:
+            browser.close_driver()
+
+        while not self._available.empty():
+            self._available.get_nowait()
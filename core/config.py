@@ -11,6 +11,18 @@ class Settings:
 
         # Database
         self.DATABASE_URL: str = os.getenv("DATABASE_URL") if not self.IS_DOCKER else os.getenv("DOCKER_DATABASE_URL")
+        # Async driver URL (empty - DATABASE_URL with postgresql+psycopg driver)
+        self.ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
+
+        # Database connection pool settings
+        self.DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+        self.DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 5))
+        self.DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+        self.DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+        self.DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        self.DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 500))
+        self.DB_PREPARE_THRESHOLD: int = int(os.getenv("DB_PREPARE_THRESHOLD", 5))
+        self.DB_EXPIRE_ON_COMMIT: bool = os.getenv("DB_EXPIRE_ON_COMMIT", "false").lower() == "true"
 
         # Freelancehunt pages
         self.FREELANCEHUNT_LOGIN_PAGE: str = os.getenv("FREELANCEHUNT_LOGIN_PAGE")
@@ -34,6 +46,72 @@ class Settings:
         # Selenium settings
         self.CHROMEDRIVER_PATH: str = os.getenv("CHROMEDRIVER_PATH") if not self.IS_DOCKER else os.getenv("DOCKER_CHROMEDRIVER_PATH")
 
+        # Lean browsing: block images/fonts/media/trackers on read-only pages
+        self.BROWSER_LEAN_MODE: bool = os.getenv("BROWSER_LEAN_MODE", "false").lower() == "true"
+        self.BROWSER_LEAN_BLOCK_CSS: bool = os.getenv("BROWSER_LEAN_BLOCK_CSS", "false").lower() == "true"
+        self.BROWSER_PAGE_LOAD_STRATEGY: str = os.getenv("BROWSER_PAGE_LOAD_STRATEGY", "eager")  # normal | eager | none (lean mode only)
+
+        # Saved login sessions (empty key - always log in with credentials)
+        self.SESSION_ENCRYPTION_KEY: str = os.getenv("SESSION_ENCRYPTION_KEY", "")
+        self.SESSION_STORE_DIR: str = os.getenv("SESSION_STORE_DIR", "data/sessions")
+
+        # Scraper settings
+        self.SCRAPER_BULK_EXTRACTION: bool = os.getenv("SCRAPER_BULK_EXTRACTION", "true").lower() == "true"
+        self.SCRAPER_PARSER_BACKEND: str = os.getenv("SCRAPER_PARSER_BACKEND", "webdriver").lower()  # webdriver | lxml
+        self.SCRAPER_FETCH_MODE: str = os.getenv("SCRAPER_FETCH_MODE", "browser").lower()  # browser | http
+        self.CRAWL_MODE: str = os.getenv("CRAWL_MODE", "manual").lower()  # manual | incremental
+        self.CRAWL_MAX_PAGES: int = int(os.getenv("CRAWL_MAX_PAGES", 10))
+        self.CRAWL_KNOWN_ROWS_TO_STOP: int = int(os.getenv("CRAWL_KNOWN_ROWS_TO_STOP", 0))  # 0 - stop on a fully known page
+
+        # Daemon mode (python main.py --daemon)
+        self.DAEMON_MARKETPLACES: list[str] = [
+            value.strip() for value in os.getenv("DAEMON_MARKETPLACES", "freelancehunt").split(",") if value.strip()
+        ]
+        self.POLL_MIN_INTERVAL: float = float(os.getenv("POLL_MIN_INTERVAL", 60))
+        self.POLL_MAX_INTERVAL: float = float(os.getenv("POLL_MAX_INTERVAL", 900))
+        self.POLL_BACKOFF_FACTOR: float = float(os.getenv("POLL_BACKOFF_FACTOR", 1.5))
+        self.SESSION_EMPTY_POLLS_TO_RELOGIN: int = int(os.getenv("SESSION_EMPTY_POLLS_TO_RELOGIN", 3))
+        self.POLL_TARGET_NEW_PROJECTS: float = float(os.getenv("POLL_TARGET_NEW_PROJECTS", 1))
+
+        # HTTP client settings
+        self.HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", 15))
+        self.HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", 10))
+
+        # Browser pool settings (1 - no pool, process projects in the main browser)
+        self.BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", 1))
+        self.BROWSER_POOL_MAX_USES: int = int(os.getenv("BROWSER_POOL_MAX_USES", 50))
+        self.BROWSER_POOL_MAX_MEMORY_MB: int = int(os.getenv("BROWSER_POOL_MAX_MEMORY_MB", 0))
+
+        # Project pages prefetch settings
+        self.PREFETCH_PROJECT_PAGES: bool = os.getenv("PREFETCH_PROJECT_PAGES", "false").lower() == "true"
+        self.PREFETCH_CONCURRENCY: int = int(os.getenv("PREFETCH_CONCURRENCY", 5))
+        self.PREFETCH_HOST_DELAY: float = float(os.getenv("PREFETCH_HOST_DELAY", 0.5))
+
+        # Known links index settings (in-memory dedup before DB lookups)
+        self.KNOWN_LINKS_INDEX: bool = os.getenv("KNOWN_LINKS_INDEX", "false").lower() == "true"
+        self.KNOWN_LINKS_CAPACITY: int = int(os.getenv("KNOWN_LINKS_CAPACITY", 500000))
+        self.KNOWN_LINKS_ERROR_RATE: float = float(os.getenv("KNOWN_LINKS_ERROR_RATE", 0.01))
+        self.KNOWN_LINKS_RECENT_SIZE: int = int(os.getenv("KNOWN_LINKS_RECENT_SIZE", 10000))
+
+        # Active projects are read and processed in batches of this size
+        self.ACTIVE_PROJECTS_BATCH_SIZE: int = int(os.getenv("ACTIVE_PROJECTS_BATCH_SIZE", 50))
+
+        # Retry of failed projects: delay * backoff ** (attempt - 1), skipped after max attempts
+        self.RETRY_DELAY: float = float(os.getenv("RETRY_DELAY", 900))
+        self.RETRY_BACKOFF_FACTOR: float = float(os.getenv("RETRY_BACKOFF_FACTOR", 2))
+        self.RETRY_MAX_ATTEMPTS: int = int(os.getenv("RETRY_MAX_ATTEMPTS", 5))
+
+        # Worker mode (python main.py --worker <marketplace>), several workers share one DB
+        self.WORKER_CLAIM_BATCH: int = int(os.getenv("WORKER_CLAIM_BATCH", 5))
+        self.WORKER_LEASE_SECONDS: float = float(os.getenv("WORKER_LEASE_SECONDS", 600))
+        self.WORKER_IDLE_SLEEP: float = float(os.getenv("WORKER_IDLE_SLEEP", 30))
+
+        # Project status updates (write-behind): immediate, buffered or journal
+        self.STATUS_UPDATES_MODE: str = os.getenv("STATUS_UPDATES_MODE", "immediate").lower()
+        self.STATUS_UPDATES_BATCH_SIZE: int = int(os.getenv("STATUS_UPDATES_BATCH_SIZE", 50))
+        self.STATUS_UPDATES_FLUSH_INTERVAL: float = float(os.getenv("STATUS_UPDATES_FLUSH_INTERVAL", 5))
+        self.STATUS_UPDATES_JOURNAL: str = os.getenv("STATUS_UPDATES_JOURNAL", "data/status_updates.journal")
+
         # OpenRouter settings
         self.OPENROUTER_API_KEY: str = os.getenv("OPENROUTER_API_KEY")
         self.OPENROUTER_AI_MODEL: str = os.getenv("OPENROUTER_AI_MODEL")
@@ -44,9 +122,43 @@ class Settings:
         self.AI_MAX_TOKENS: int = int(os.getenv("AI_MAX_TOKENS", 1000))
         self.AI_SYSTEM_CONTENT: str = os.getenv("AI_SYSTEM_CONTENT")
 
+        # Two-stage AI: classifier model answers yes/no, generation model
+        # (OPENROUTER_AI_MODEL, AI_MAX_TOKENS) writes proposals for accepted projects
+        self.AI_TWO_STAGE: bool = os.getenv("AI_TWO_STAGE", "false").lower() == "true"
+        self.AI_CLASSIFIER_MODEL: str = os.getenv("AI_CLASSIFIER_MODEL", "openai/gpt-4o-mini")
+        self.AI_CLASSIFIER_MAX_TOKENS: int = int(os.getenv("AI_CLASSIFIER_MAX_TOKENS", 3))
+
+        # Stream answers: "false" is detected on the first tokens and the
+        # bid form is opened while an accepted message is still generated
+        self.AI_STREAMING: bool = os.getenv("AI_STREAMING", "false").lower() == "true"
+
+        # AI response cache (SQLite)
+        self.AI_CACHE_ENABLED: bool = os.getenv("AI_CACHE_ENABLED", "true").lower() == "true"
+        self.AI_CACHE_PATH: str = os.getenv("AI_CACHE_PATH", "data/ai_cache.sqlite3")
+        self.AI_CACHE_TTL: float = float(os.getenv("AI_CACHE_TTL", 7 * 24 * 3600))
+        self.AI_CACHE_MAX_ENTRIES: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", 10000))
+
+        # Keyword pre-filter before AI (comma-separated, case-insensitive)
+        self.AI_PREFILTER_ENABLED: bool = os.getenv("AI_PREFILTER_ENABLED", "true").lower() == "true"
+        self.AI_PREFILTER_EXCLUDE: list[str] = [
+            value.strip() for value in os.getenv(
+                "AI_PREFILTER_EXCLUDE", "wordpress,вордпрес,wix,squarespace,shopify,tilda,webflow,opencart"
+            ).split(",") if value.strip()
+        ]
+        self.AI_PREFILTER_INCLUDE: list[str] = [
+            value.strip() for value in os.getenv("AI_PREFILTER_INCLUDE", "").split(",") if value.strip()
+        ]
+
+        # Async AI client (overlaps AI calls with browser work)
+        self.AI_ASYNC_ENABLED: bool = os.getenv("AI_ASYNC_ENABLED", "false").lower() == "true"
+        self.AI_MAX_IN_FLIGHT: int = int(os.getenv("AI_MAX_IN_FLIGHT", 4))
+        self.AI_REQUESTS_PER_MINUTE: float = float(os.getenv("AI_REQUESTS_PER_MINUTE", 20))
+        self.AI_TOKENS_PER_MINUTE: float = float(os.getenv("AI_TOKENS_PER_MINUTE", 0))
+
         # Initialize client
+        self.OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"
         self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
+            base_url=self.OPENROUTER_BASE_URL,
             api_key=self.OPENROUTER_API_KEY
         )
 
@@ -1,11 +1,25 @@
 """Dependency Injection Container."""
+import weakref
+from contextlib import contextmanager
+from typing import Iterator
+
+from ai.async_client import AsyncAI
+from ai.client import AI
 from db import Base, Session, engine
-from db.repositories import ProjectRepository
+from db.link_index import KnownLinkIndex
+from db.repositories import (
+    AsyncProjectRepository,
+    CrawlStateRepository,
+    ProjectRepository,
+    ProjectUpdateBuffer,
+)
 from schemas.project import MarketplaceEnum
 from scraper import get_scraper
 from scraper.base import ProjectsScraperFactory
 from services import ProjectService
 from core.browser import Browser
+from core.http_client import HttpClient
+from core.browser_pool import BrowserPool
 from core.loggers import db_logger as logger
 
 
@@ -14,7 +28,12 @@ class Container:
     
     def __init__(self):
         self._browser = None
-        self._session = None
+        self._http_clients: dict[MarketplaceEnum, HttpClient] = {}
+        self._browser_pool = None
+        self._sessions = weakref.WeakSet()
+        self._link_index = None
+        self._update_buffer = None
+        self._async_ai = None
     
     @property
     def browser(self) -> Browser:
@@ -23,15 +42,111 @@ class Container:
             self._browser = Browser()
         return self._browser
     
+    def get_http_client(self, marketplace: MarketplaceEnum) -> HttpClient:
+        """Get HTTP client sharing browser session cookies (one per marketplace).
+        
+        Must be first called right after logging in to the marketplace,
+        while the browser is on its domain, so its cookies are exported.
+        """
+        if marketplace not in self._http_clients:
+            self._http_clients[marketplace] = HttpClient.from_browser(self.browser)
+        return self._http_clients[marketplace]
+    
+    def refresh_http_client(self, marketplace: MarketplaceEnum) -> None:
+        """Copy current browser cookies into the marketplace HTTP client, if it exists.
+        
+        Call while the browser is on the marketplace domain (e.g. after login).
+        """
+        if marketplace in self._http_clients:
+            self._http_clients[marketplace].refresh_from_browser(self.browser)
+    
+    @property
+    def browser_pool(self) -> BrowserPool:
+        """Get browser pool sharing the main browser session (singleton).
+        
+        Must be first accessed after login, so the session cookies are replicated.
+        """
+        if self._browser_pool is None:
+            self._browser_pool = BrowserPool()
+            self._browser_pool.start(self.browser)
+        return self._browser_pool
+    
     @property
     def db_session(self):
-        """Get database session (new instance each time)."""
-        return Session()
+        """Get database session (new instance each time).
+        
+        Sessions are tracked and closed by `release_sessions()` / `cleanup()`.
+        """
+        session = Session()
+        self._sessions.add(session)
+        return session
+    
+    def release_sessions(self) -> None:
+        """Close all sessions handed out so far.
+        
+        Returns their connections to the pool and clears identity maps.
+        A closed session is reusable, its repositories keep working and
+        open a new transaction on next use.
+        """
+        for session in list(self._sessions):
+            session.close()
+    
+    @contextmanager
+    def session_scope(self) -> Iterator[None]:
+        """Unit of work (one daemon poll, one worker batch).
+        
+        Sessions handed out by the container are closed at exit, even on
+        error: uncommitted work is rolled back and connections go back to
+        the pool, so nothing is held while the daemon sleeps.
+        """
+        try:
+            yield
+        finally:
+            self.release_sessions()
     
     @property
     def project_repository(self) -> ProjectRepository:
         """Get project repository instance."""
         return ProjectRepository(self.db_session)
+    
+    @property
+    def async_project_repository(self) -> AsyncProjectRepository:
+        """Get async project repository instance (new AsyncSession, close it when done)."""
+        # Imported here: creating the async engine requires the async driver
+        from db.async_session import AsyncSession
+        return AsyncProjectRepository(AsyncSession())
+    
+    @property
+    def link_index(self) -> KnownLinkIndex:
+        """Get known links index loaded from all stored project links (singleton)."""
+        if self._link_index is None:
+            self._link_index = KnownLinkIndex()
+            repository = self.project_repository
+            try:
+                self._link_index.load(repository.iter_links())
+            finally:
+                repository.session.close()
+        return self._link_index
+    
+    @property
+    def update_buffer(self) -> ProjectUpdateBuffer:
+        """Get write-behind buffer for project status updates (singleton)."""
+        if self._update_buffer is None:
+            # Own untracked session: it is used from the background flush thread
+            self._update_buffer = ProjectUpdateBuffer(lambda: ProjectRepository(Session()))
+        return self._update_buffer
+    
+    @property
+    def async_ai(self) -> AsyncAI:
+        """Get async AI client with in-flight and rate limits (singleton)."""
+        if self._async_ai is None:
+            self._async_ai = AsyncAI()
+        return self._async_ai
+    
+    @property
+    def crawl_state_repository(self) -> CrawlStateRepository:
+        """Get crawl state repository instance."""
+        return CrawlStateRepository(self.db_session)
  
  
     def start_db(self):
@@ -53,11 +168,24 @@ class Container:
     
     def cleanup(self):
         """Cleanup resources."""
+        if self._update_buffer:
+            self._update_buffer.close()
+            self._update_buffer = None
+        if self._browser_pool:
+            self._browser_pool.close()
+            self._browser_pool = None
         if self._browser:
             self._browser.close_driver()
             self._browser = None
-        if self._session:
-            self._session.close()
-            self._session = None
+        for http_client in self._http_clients.values():
+            http_client.close()
+        self._http_clients = {}
+        if self._async_ai:
+            self._async_ai.close()
+            self._async_ai = None
+        AI.close_cache()
+        self.release_sessions()
+        self._sessions = weakref.WeakSet()
+        engine.dispose()
         
 
@@ -0,0 +1,112 @@
+"""Pooled HTTP client that reuses the authenticated browser session."""
+from typing import Optional
+
+import httpx
+
+from core.browser import Browser
+from core.config import settings
+from core.exceptions import PageLoadError
+from core.loggers import requests_logger as logger
+
+
+class HttpClient:
+    """Keep-alive HTTP client for read-only pages (listings, project details).
+
+    Carries the cookies and User-Agent of a logged-in Browser, so pages
+    are fetched as the same user without rendering them in Chrome.
+    """
+
+    def __init__(self, cookies: Optional[list[dict]] = None, user_agent: Optional[str] = None):
+        """Initialize HTTP client.
+
+        Args:
+            cookies: Cookies in WebDriver format (dicts with name, value, domain, path)
+            user_agent: User-Agent header to send
+        """
+        headers = {"Accept": "text/html,application/xhtml+xml"}
+        if user_agent:
+            headers["User-Agent"] = user_agent
+
+        self.client = httpx.Client(
+            headers=headers,
+            timeout=settings.HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_CONNECTIONS,
+            ),
+        )
+        self.set_cookies(cookies or [])
+
+    @classmethod
+    def from_browser(cls, browser: Browser) -> "HttpClient":
+        """Create HTTP client with cookies and User-Agent of the browser session.
+
+        Args:
+            browser: Browser instance (should be logged in)
+        """
+        driver = browser.driver
+        user_agent = driver.execute_script("return navigator.userAgent")
+        cookies = driver.get_cookies()
+        logger.info(f"Exported {len(cookies)} cookies from browser session")
+        return cls(cookies=cookies, user_agent=user_agent)
+
+    def async_client(self, max_connections: Optional[int] = None) -> httpx.AsyncClient:
+        """Create async client with the same headers and session cookies.
+
+        Args:
+            max_connections: Connection pool size (defaults to HTTP_MAX_CONNECTIONS)
+        """
+        max_connections = max_connections or settings.HTTP_MAX_CONNECTIONS
+        return httpx.AsyncClient(
+            headers=self.client.headers,
+            cookies=self.client.cookies,
+            timeout=settings.HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    def refresh_from_browser(self, browser: Browser) -> None:
+        """Replace session cookies with the current cookies of the browser (e.g. after re-login)."""
+        cookies = browser.driver.get_cookies()
+        self.client.cookies.clear()
+        self.set_cookies(cookies)
+        logger.info(f"Refreshed {len(cookies)} cookies from browser session")
+
+    def set_cookies(self, cookies: list[dict]) -> None:
+        """Add WebDriver-format cookies to the client cookie jar."""
+        for cookie in cookies:
+            self.client.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def get(self, url: str) -> httpx.Response:
+        """Fetch page over HTTP.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Response (after redirects)
+
+        Raises:
+            PageLoadError: On network error or non-2xx status
+        """
+        try:
+            response = self.client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            raise PageLoadError(f"Failed to fetch {url}: {e}") from e
+
+        logger.debug(f"GET {url} -> {response.status_code} ({len(response.content)} bytes)")
+        return response
+
+    def close(self) -> None:
+        self.client.close()
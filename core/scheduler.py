@@ -0,0 +1,86 @@
+"""Adaptive polling schedule for daemon mode."""
+import time
+from datetime import datetime
+from typing import Optional
+
+from core.config import settings
+
+
+class AdaptivePollScheduler:
+    """Picks the delay until the next poll of one marketplace.
+
+    Keeps an exponentially weighted arrival rate of new projects for every
+    hour of day and polls about as often as one new project is expected
+    (`target_new_projects / rate`). Polls that find nothing back off
+    geometrically. The result is clamped to [min_interval, max_interval].
+    """
+
+    def __init__(
+        self,
+        min_interval: float = settings.POLL_MIN_INTERVAL,
+        max_interval: float = settings.POLL_MAX_INTERVAL,
+        backoff_factor: float = settings.POLL_BACKOFF_FACTOR,
+        target_new_projects: float = settings.POLL_TARGET_NEW_PROJECTS,
+        smoothing: float = 0.3,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            min_interval: Shortest delay between polls (seconds)
+            max_interval: Longest delay between polls (seconds)
+            backoff_factor: Delay multiplier per consecutive empty poll
+            target_new_projects: How many new projects one poll should find on average
+            smoothing: EWMA weight of the latest observation (0..1]
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff_factor = backoff_factor
+        self.target_new_projects = target_new_projects
+        self.smoothing = smoothing
+
+        self.hourly_rate: list[Optional[float]] = [None] * 24  # new projects per second
+        self.empty_polls = 0
+        self._last_poll: Optional[float] = None
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def record(self, new_projects: int, now: Optional[datetime] = None) -> float:
+        """Record poll result and get delay until the next poll.
+
+        Args:
+            new_projects: Number of new projects found by the poll
+            now: Poll time (defaults to current local time)
+
+        Returns:
+            Seconds to wait before the next poll
+        """
+        now = now or datetime.now()
+        monotonic_now = time.monotonic()
+        hour = now.hour
+
+        if self._last_poll is not None:
+            elapsed = max(monotonic_now - self._last_poll, 1.0)
+            sample = new_projects / elapsed
+            previous = self.hourly_rate[hour]
+            self.hourly_rate[hour] = sample if previous is None else (
+                self.smoothing * sample + (1 - self.smoothing) * previous
+            )
+        self._last_poll = monotonic_now
+
+        self.empty_polls = 0 if new_projects else self.empty_polls + 1
+
+        return self.next_interval(now)
+
+    def next_interval(self, now: Optional[datetime] = None) -> float:
+        """Get delay until the next poll based on observed arrival rate."""
+        now = now or datetime.now()
+        rate = self.hourly_rate[now.hour]
+
+        # No arrivals seen this hour yet - rely on backoff below
+        interval = self.target_new_projects / rate if rate else self.min_interval
+
+        if self.empty_polls:
+            interval = max(interval, self.min_interval * self.backoff_factor ** self.empty_polls)
+
+        return self._clamp(interval)
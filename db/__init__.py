@@ -1,9 +1,36 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, echo=False)
-Session = sessionmaker(bind=engine)
+
+def get_engine_options(url: str) -> dict:
+    """Build create_engine() keyword arguments from settings for given URL."""
+    url = make_url(url)
+    options = {
+        "echo": False,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "query_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+    # SQLite uses its own pool classes without size limits
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+
+    # psycopg 3 prepares statements server-side after N executions
+    if url.get_driver_name() == "psycopg":
+        options["connect_args"] = {"prepare_threshold": settings.DB_PREPARE_THRESHOLD}
+
+    return options
+
+
+engine = create_engine(settings.DATABASE_URL, **get_engine_options(settings.DATABASE_URL))
+Session = sessionmaker(bind=engine, expire_on_commit=settings.DB_EXPIRE_ON_COMMIT)
 
 class Base(DeclarativeBase):
     pass
@@ -14,4 +41,5 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
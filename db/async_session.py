@@ -0,0 +1,38 @@
+"""Async engine and session factory (asyncio pipelines)."""
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession as AsyncSessionType, async_sessionmaker, create_async_engine
+
+from db import get_engine_options
+from core.config import settings
+
+
+# Async driver for every sync backend in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+psycopg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    """Get ASYNC_DATABASE_URL, or DATABASE_URL switched to an async driver."""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = make_url(settings.DATABASE_URL)
+    drivername = ASYNC_DRIVERS.get(url.get_backend_name())
+    if drivername is None:
+        raise ValueError(f"No async driver known for {url.get_backend_name()}, set ASYNC_DATABASE_URL")
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = get_async_database_url()
+try:
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **get_engine_options(ASYNC_DATABASE_URL))
+except ImportError as e:
+    raise ImportError(
+        f"Async driver {make_url(ASYNC_DATABASE_URL).drivername} is not installed "
+        f"(pip install -r requirements.txt) or set ASYNC_DATABASE_URL: {e}"
+    ) from e
+
+# Attributes can't be lazy-loaded after commit in async code, so never expire them
+AsyncSession = async_sessionmaker(bind=async_engine, class_=AsyncSessionType, expire_on_commit=False)
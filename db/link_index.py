@@ -0,0 +1,140 @@
+"""Process-local index of known project links (Bloom filter + LRU)."""
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Iterable
+
+from core.config import settings
+from core.loggers import db_logger as logger
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter for strings."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        """Initialize Bloom filter.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # Double hashing: h1 + i * h2
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class KnownLinkIndex:
+    """Answers "is this link already stored?" without a DB query where possible.
+
+    - Bloom filter negative: link is definitely new.
+    - Exact LRU hit: link is definitely known.
+    - Otherwise the link is uncertain and must be checked in DB.
+    """
+
+    def __init__(
+        self,
+        capacity: int = settings.KNOWN_LINKS_CAPACITY,
+        error_rate: float = settings.KNOWN_LINKS_ERROR_RATE,
+        recent_size: int = settings.KNOWN_LINKS_RECENT_SIZE,
+    ):
+        """Initialize index.
+
+        Args:
+            capacity: Expected number of stored links (Bloom filter size)
+            error_rate: Bloom filter false positive rate at capacity
+            recent_size: Max links kept in the exact LRU set
+        """
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.recent_size = recent_size
+        self.recent: OrderedDict[str, None] = OrderedDict()
+
+        self.lookups = 0
+        self.definitely_new = 0
+        self.recent_hits = 0
+        self.db_checks = 0
+        self.false_positives = 0
+
+    def load(self, links: Iterable[str]) -> None:
+        """Add stored links to the Bloom filter (e.g. all projects.link at startup)."""
+        for link in links:
+            self.bloom.add(link)
+
+        logger.info(f"Known link index loaded: {self.bloom.count} links, {len(self.bloom.bits) // 1024} KB")
+        if self.bloom.count > self.bloom.capacity:
+            logger.warning(
+                f"Known link index holds {self.bloom.count} links, more than capacity "
+                f"{self.bloom.capacity}; false positive rate will grow, raise KNOWN_LINKS_CAPACITY"
+            )
+
+    def _touch(self, link: str) -> None:
+        self.recent[link] = None
+        self.recent.move_to_end(link)
+        if len(self.recent) > self.recent_size:
+            self.recent.popitem(last=False)
+
+    def add(self, links: Iterable[str]) -> None:
+        """Mark links as stored (call after insert or after DB confirmed them)."""
+        for link in links:
+            if link not in self.bloom:
+                self.bloom.add(link)
+            self._touch(link)
+
+    def classify(self, links: Iterable[str]) -> tuple[set[str], set[str], set[str]]:
+        """Split links by what is known about them without DB.
+
+        Returns:
+            Tuple of (known, new, uncertain) link sets
+        """
+        known, new, uncertain = set(), set(), set()
+
+        for link in links:
+            self.lookups += 1
+            if link in self.recent:
+                self.recent.move_to_end(link)
+                self.recent_hits += 1
+                known.add(link)
+            elif link not in self.bloom:
+                self.definitely_new += 1
+                new.add(link)
+            else:
+                uncertain.add(link)
+
+        self.db_checks += len(uncertain)
+        return known, new, uncertain
+
+    def record_db_result(self, uncertain: set[str], existing: set[str]) -> None:
+        """Update stats and LRU with the DB answer for uncertain links."""
+        self.false_positives += len(uncertain - existing)
+        self.add(existing)
+
+    @property
+    def stats(self) -> dict:
+        """Lookup statistics."""
+        return {
+            "links": self.bloom.count,
+            "recent": len(self.recent),
+            "lookups": self.lookups,
+            "definitely_new": self.definitely_new,
+            "recent_hits": self.recent_hits,
+            "db_checks": self.db_checks,
+            "false_positives": self.false_positives,
+            "db_skip_rate": round(1 - self.db_checks / self.lookups, 3) if self.lookups else 0.0,
+        }
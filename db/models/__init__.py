@@ -1 +1,2 @@
-from .project import Project
\ No newline at end of file
+from .project import Project
+from .crawl_state import CrawlState
\ No newline at end of file
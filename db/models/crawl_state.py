@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from db import Base
+
+class CrawlState(Base):
+    """Incremental crawl high-water mark per marketplace."""
+    __tablename__ = "crawl_state"
+
+    marketplace: Mapped[str] = mapped_column(String(32), primary_key=True)
+    last_seen_link: Mapped[str] = mapped_column(nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"CrawlState(marketplace={self.marketplace}, last_seen_link={self.last_seen_link})"
@@ -1,22 +1,72 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 from db import Base
-from schemas.project import MarketplaceEnum
+from schemas.project import ACTIVE_STATUSES, AIVerdictEnum, MarketplaceEnum, ProjectStatusEnum
 from sqlalchemy.types import Enum as SQLEnum
 
+# Rows still waiting for a bid decision. The same literal text is used in the
+# partial index and in work queries, so the planner always matches the index
+ACTIVE_PROJECTS_CONDITION = text(
+    "status IN ({})".format(", ".join(f"'{status.value}'" for status in ACTIVE_STATUSES))
+)
+
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Partial work-queue index: only active projects, so it stays small as history grows.
+        # next_attempt_at is included so the retry filter doesn't touch the table
+        Index(
+            "ix_projects_queue",
+            "id",
+            "next_attempt_at",
+            postgresql_where=ACTIVE_PROJECTS_CONDITION,
+            sqlite_where=ACTIVE_PROJECTS_CONDITION,
+        ),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(nullable=False)
-    link: Mapped[str] = mapped_column(nullable=False)
+    link: Mapped[str] = mapped_column(nullable=False, unique=True, index=True)
     price: Mapped[int] = mapped_column(nullable=True)
     currency: Mapped[str] = mapped_column(nullable=True, default="UAH")
     marketplace: Mapped[MarketplaceEnum] = mapped_column(SQLEnum(MarketplaceEnum), nullable=False)
 
     bid_message: Mapped[str] = mapped_column(nullable=True)
 
-    is_bid_placed: Mapped[bool] = mapped_column(default=False)
-    is_bid_skipped: Mapped[bool] = mapped_column(default=False)
+    # Cleaned description and AI verdict on it, reused when the same description comes again
+    description: Mapped[str] = mapped_column(Text, nullable=True)
+    description_hash: Mapped[str] = mapped_column(String(64), nullable=True, index=True)
+    ai_verdict: Mapped[AIVerdictEnum] = mapped_column(
+        SQLEnum(
+            AIVerdictEnum,
+            native_enum=False,
+            length=16,
+            values_callable=lambda verdicts: [verdict.value for verdict in verdicts],
+        ),
+        nullable=True,
+    )
+
+    status: Mapped[ProjectStatusEnum] = mapped_column(
+        SQLEnum(
+            ProjectStatusEnum,
+            name="project_status",
+            values_callable=lambda statuses: [status.value for status in statuses],
+        ),
+        nullable=False,
+        default=ProjectStatusEnum.NEW,
+        index=True,
+    )
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    processed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Worker lease (see ProjectRepository.claim_projects)
+    claimed_by: Mapped[str] = mapped_column(nullable=True)
+    lease_expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
 
     def __repr__(self):
-        return f"Project(id={self.id}, title={self.title}, link={self.link}, price={self.price})"
\ No newline at end of file
+        return f"Project(id={self.id}, title={self.title}, link={self.link}, price={self.price}, status={self.status})"
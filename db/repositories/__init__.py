@@ -1,4 +1,6 @@
 """Repositories for database entities."""
 from db.repositories.base import BaseRepository
 from db.repositories.project_repository import ProjectRepository
-
+from db.repositories.async_project_repository import AsyncProjectRepository
+from db.repositories.crawl_state_repository import CrawlStateRepository
+from db.repositories.project_update_buffer import ProjectUpdateBuffer
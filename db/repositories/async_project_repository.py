@@ -0,0 +1,267 @@
+"""Async project repository implementation."""
+from typing import AsyncIterator, Iterable, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from db.models import Project
+from db.repositories.project_repository import (
+    LINKS_CHUNK_SIZE,
+    UPDATE_BY_ID,
+    UPSERT_INSERTS,
+    due_projects_clause,
+    group_updates,
+)
+from schemas.project import CreateProjectSchema, UpdateProjectSchema
+from core.config import settings
+from core.exceptions import ProjectNotFoundError, DuplicateProjectError, DatabaseError
+from core.loggers import db_logger as logger
+
+
+class AsyncProjectRepository:
+    """Repository for Project entity on AsyncSession.
+
+    Same methods as ProjectRepository, awaited. Use with
+    `db.async_session.AsyncSession`, one session per task.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, id: int) -> Optional[Project]:
+        """Get project by ID."""
+        try:
+            return await self.session.get(Project, id)
+        except Exception as e:
+            logger.error(f"Failed to get project by id {id}: {e}")
+            raise DatabaseError(f"Failed to get project: {e}") from e
+
+    async def get_by_link(self, link: str) -> Optional[Project]:
+        """Get project by link."""
+        try:
+            return (await self.session.scalars(
+                select(Project).where(Project.link == link)
+            )).first()
+        except Exception as e:
+            logger.error(f"Failed to get project by link {link}: {e}")
+            raise DatabaseError(f"Failed to get project: {e}") from e
+
+    async def get_evaluated_by_description_hash(self, description_hash: str) -> Optional[Project]:
+        """Get the latest project whose description with this hash already has an AI verdict."""
+        try:
+            return (await self.session.scalars(
+                select(Project)
+                .where(Project.description_hash == description_hash)
+                .where(Project.ai_verdict.is_not(None))
+                .order_by(Project.id.desc())
+                .limit(1)
+            )).first()
+        except Exception as e:
+            logger.error(f"Failed to get project by description hash {description_hash}: {e}")
+            raise DatabaseError(f"Failed to get project: {e}") from e
+
+    async def get_existing_links(self, links: Iterable[str]) -> set[str]:
+        """Get which of the given links are already stored (one query per chunk)."""
+        links = list(dict.fromkeys(links))
+        existing = set()
+
+        try:
+            for start in range(0, len(links), LINKS_CHUNK_SIZE):
+                chunk = links[start:start + LINKS_CHUNK_SIZE]
+                existing.update(await self.session.scalars(
+                    select(Project.link).where(Project.link.in_(chunk))
+                ))
+            return existing
+        except Exception as e:
+            logger.error(f"Failed to check existing links: {e}")
+            raise DatabaseError(f"Failed to check existing links: {e}") from e
+
+    async def get_all(self) -> list[Project]:
+        """Get all projects."""
+        try:
+            return list(await self.session.scalars(select(Project)))
+        except Exception as e:
+            logger.error(f"Failed to get all projects: {e}")
+            raise DatabaseError(f"Failed to get projects: {e}") from e
+
+    async def get_active_projects(self) -> list[Project]:
+        """Get active projects whose next attempt is due."""
+        try:
+            return list(await self.session.scalars(
+                select(Project)
+                .where(due_projects_clause())
+            ))
+        except Exception as e:
+            logger.error(f"Failed to get active projects: {e}")
+            raise DatabaseError(f"Failed to get active projects: {e}") from e
+
+    async def iter_active_project_batches(
+        self,
+        batch_size: int = settings.ACTIVE_PROJECTS_BATCH_SIZE,
+        newest_first: bool = False,
+    ) -> AsyncIterator[list[Project]]:
+        """Stream active projects in keyset-paginated batches ordered by id."""
+        last_id = None
+
+        while True:
+            stmt = (
+                select(Project)
+                .where(due_projects_clause())
+                .order_by(Project.id.desc() if newest_first else Project.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(Project.id < last_id if newest_first else Project.id > last_id)
+
+            try:
+                batch = list(await self.session.scalars(stmt))
+            except Exception as e:
+                logger.error(f"Failed to get active projects batch: {e}")
+                raise DatabaseError(f"Failed to get active projects: {e}") from e
+
+            if not batch:
+                return
+
+            yield batch
+
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].id
+
+    async def create(self, project_data: CreateProjectSchema) -> Project:
+        """Create a new project."""
+        try:
+            existing = await self.get_by_link(project_data.link)
+            if existing:
+                raise DuplicateProjectError(f"Project with link {project_data.link} already exists")
+
+            project = Project(**project_data.model_dump())
+            self.session.add(project)
+            await self.session.commit()
+            await self.session.refresh(project)
+
+            logger.info(f"Created project: {project.title} (ID: {project.id})")
+            return project
+
+        except DuplicateProjectError:
+            raise
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error(f"Integrity error creating project: {e}")
+            raise DuplicateProjectError(f"Project already exists: {e}") from e
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to create project: {e}")
+            raise DatabaseError(f"Failed to create project: {e}") from e
+
+    async def create_many(self, projects_data: list[CreateProjectSchema]) -> list[Project]:
+        """Create multiple projects at once, skipping links that already exist.
+
+        Single INSERT ... ON CONFLICT (link) DO NOTHING RETURNING statement.
+        """
+        # Drop links repeated in this batch
+        rows_by_link = {}
+        for project_data in projects_data:
+            rows_by_link.setdefault(project_data.link, project_data.model_dump())
+        rows = list(rows_by_link.values())
+
+        if not rows:
+            return []
+
+        dialect = self.session.get_bind().dialect.name
+        insert = UPSERT_INSERTS.get(dialect)
+        if insert is None:
+            raise DatabaseError(f"Bulk insert is not supported for {dialect}")
+
+        try:
+            stmt = (
+                insert(Project)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[Project.link])
+                .returning(Project)
+            )
+            created_projects = list(await self.session.scalars(stmt))
+            await self.session.commit()
+
+            logger.info(f"Created {len(created_projects)} projects ({len(rows) - len(created_projects)} already existed)")
+            return created_projects
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to create projects batch: {e}")
+            raise DatabaseError(f"Failed to create projects: {e}") from e
+
+    async def update(self, project_id: int, update_data: UpdateProjectSchema) -> Project:
+        """Update project."""
+        try:
+            project = await self.get_by_id(project_id)
+            if not project:
+                raise ProjectNotFoundError(f"Project with id {project_id} not found")
+
+            data_dict = update_data.model_dump(exclude_none=True, exclude_unset=True)
+            for key, value in data_dict.items():
+                setattr(project, key, value)
+
+            await self.session.commit()
+            await self.session.refresh(project)
+
+            logger.info(f"Updated project: {project.title} (ID: {project.id}), data: {data_dict}")
+            return project
+
+        except ProjectNotFoundError:
+            raise
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to update project {project_id}: {e}")
+            raise DatabaseError(f"Failed to update project: {e}") from e
+
+    async def update_many(self, updates: dict[int, dict]) -> int:
+        """Apply column values to many projects in one transaction (deleted projects are dropped)."""
+        project_ids = list(updates)
+
+        try:
+            existing_ids = set()
+            for start in range(0, len(project_ids), LINKS_CHUNK_SIZE):
+                chunk = project_ids[start:start + LINKS_CHUNK_SIZE]
+                existing_ids.update(await self.session.scalars(select(Project.id).where(Project.id.in_(chunk))))
+
+            missing_ids = updates.keys() - existing_ids
+            if missing_ids:
+                logger.warning(f"Dropping updates of {len(missing_ids)} deleted projects: {sorted(missing_ids)}")
+
+            batches = group_updates(updates, existing_ids)
+            for rows in batches.values():
+                await self.session.execute(UPDATE_BY_ID, rows)
+            await self.session.commit()
+
+            logger.info(f"Updated {len(existing_ids)} projects in {len(batches)} batches")
+            return len(existing_ids)
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to update projects batch: {e}")
+            raise DatabaseError(f"Failed to update projects: {e}") from e
+
+    async def delete(self, id: int) -> bool:
+        """Delete project by ID."""
+        try:
+            project = await self.get_by_id(id)
+            if not project:
+                raise ProjectNotFoundError(f"Project with id {id} not found")
+
+            await self.session.delete(project)
+            await self.session.commit()
+
+            logger.info(f"Deleted project: {project.title} (ID: {id})")
+            return True
+
+        except ProjectNotFoundError:
+            raise
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to delete project {id}: {e}")
+            raise DatabaseError(f"Failed to delete project: {e}") from e
+
+    async def exists_by_link(self, link: str) -> bool:
+        """Check if project with given link exists."""
+        return await self.get_by_link(link) is not None
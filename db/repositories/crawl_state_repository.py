@@ -0,0 +1,41 @@
+"""Crawl state repository implementation."""
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from db.models import CrawlState
+from schemas.project import MarketplaceEnum
+from core.exceptions import DatabaseError
+from core.loggers import db_logger as logger
+
+
+class CrawlStateRepository:
+    """Repository for per-marketplace crawl watermarks."""
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def get_watermark(self, marketplace: MarketplaceEnum) -> Optional[str]:
+        """Get link of the newest project seen by the last crawl."""
+        try:
+            state = self.session.get(CrawlState, marketplace.value)
+            return state.last_seen_link if state else None
+        except Exception as e:
+            logger.error(f"Failed to get watermark for {marketplace.value}: {e}")
+            raise DatabaseError(f"Failed to get watermark: {e}") from e
+    
+    def set_watermark(self, marketplace: MarketplaceEnum, link: str) -> None:
+        """Store link of the newest project seen by the current crawl."""
+        try:
+            state = self.session.get(CrawlState, marketplace.value)
+            if state is None:
+                state = CrawlState(marketplace=marketplace.value)
+                self.session.add(state)
+            state.last_seen_link = link
+            self.session.commit()
+            
+            logger.info(f"Updated {marketplace.value} watermark: {link}")
+            
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to set watermark for {marketplace.value}: {e}")
+            raise DatabaseError(f"Failed to set watermark: {e}") from e
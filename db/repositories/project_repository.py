@@ -1,16 +1,55 @@
 """Project repository implementation."""
-from typing import Optional
-from sqlalchemy import select
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Optional
+from sqlalchemy import and_, bindparam, or_, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from db.models import Project
+from db.models.project import ACTIVE_PROJECTS_CONDITION
 from db.repositories.base import BaseRepository
-from schemas.project import CreateProjectSchema, UpdateProjectSchema
+from schemas.project import CreateProjectSchema, MarketplaceEnum, UpdateProjectSchema
+from core.config import settings
 from core.exceptions import ProjectNotFoundError, DuplicateProjectError, DatabaseError
 from core.loggers import db_logger as logger
 
 
+# Max links per IN (...) query
+LINKS_CHUNK_SIZE = 500
+
+# Core executemany UPDATE by id: unlike ORM bulk update by primary key,
+# rows of deleted projects match nothing instead of failing the batch
+UPDATE_BY_ID = update(Project.__table__).where(Project.__table__.c.id == bindparam("_id"))
+
+
+def group_updates(updates: dict[int, dict], existing_ids: set[int]) -> dict[tuple[str, ...], list[dict]]:
+    """Group update rows of existing projects by their set of columns (one executemany each)."""
+    batches: dict[tuple[str, ...], list[dict]] = {}
+    for project_id, values in updates.items():
+        if project_id in existing_ids:
+            batches.setdefault(tuple(sorted(values)), []).append({"_id": project_id, **values})
+    return batches
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def due_projects_clause(now: Optional[datetime] = None):
+    """WHERE clause for active projects that are not waiting for a retry
+    and are not leased to a worker."""
+    now = now or datetime.now(timezone.utc)
+    return and_(
+        ACTIVE_PROJECTS_CONDITION,
+        or_(Project.next_attempt_at.is_(None), Project.next_attempt_at <= now),
+        or_(Project.lease_expires_at.is_(None), Project.lease_expires_at < now),
+    )
+
+
 class ProjectRepository(BaseRepository[Project]):
     """Repository for Project entity."""
     
@@ -35,6 +74,57 @@ class ProjectRepository(BaseRepository[Project]):
             logger.error(f"Failed to get project by link {link}: {e}")
             raise DatabaseError(f"Failed to get project: {e}") from e
     
+    def get_evaluated_by_description_hash(self, description_hash: str) -> Optional[Project]:
+        """Get the latest project whose description with this hash already has an AI verdict."""
+        try:
+            return self.session.scalars(
+                select(Project)
+                .where(Project.description_hash == description_hash)
+                .where(Project.ai_verdict.is_not(None))
+                .order_by(Project.id.desc())
+                .limit(1)
+            ).first()
+        except Exception as e:
+            logger.error(f"Failed to get project by description hash {description_hash}: {e}")
+            raise DatabaseError(f"Failed to get project: {e}") from e
+    
+    def get_existing_links(self, links: Iterable[str]) -> set[str]:
+        """Get which of the given links are already stored (one query per chunk).
+        
+        Args:
+            links: Project links to check
+            
+        Returns:
+            Set of links that exist in database
+        """
+        links = list(dict.fromkeys(links))
+        existing = set()
+        
+        try:
+            for start in range(0, len(links), LINKS_CHUNK_SIZE):
+                chunk = links[start:start + LINKS_CHUNK_SIZE]
+                existing.update(self.session.scalars(
+                    select(Project.link).where(Project.link.in_(chunk))
+                ).all())
+            return existing
+        except Exception as e:
+            logger.error(f"Failed to check existing links: {e}")
+            raise DatabaseError(f"Failed to check existing links: {e}") from e
+    
+    def iter_links(self, batch_size: int = 1000) -> Iterator[str]:
+        """Stream all stored project links without loading them at once.
+        
+        Args:
+            batch_size: Rows fetched per round trip
+        """
+        try:
+            yield from self.session.scalars(
+                select(Project.link).execution_options(yield_per=batch_size)
+            )
+        except Exception as e:
+            logger.error(f"Failed to iterate project links: {e}")
+            raise DatabaseError(f"Failed to iterate project links: {e}") from e
+    
     def get_all(self) -> list[Project]:
         """Get all projects."""
         try:
@@ -44,17 +134,153 @@ class ProjectRepository(BaseRepository[Project]):
             raise DatabaseError(f"Failed to get projects: {e}") from e
     
     def get_active_projects(self) -> list[Project]:
-        """Get projects that don't have bids placed and are not skipped."""
+        """Get active projects whose next attempt is due."""
         try:
             return list(self.session.scalars(
                 select(Project)
-                .where(Project.is_bid_placed.is_(False))
-                .where(Project.is_bid_skipped.is_(False))
+                .where(due_projects_clause())
             ).all())
         except Exception as e:
             logger.error(f"Failed to get active projects: {e}")
             raise DatabaseError(f"Failed to get active projects: {e}") from e
     
+    def iter_active_project_batches(
+        self,
+        batch_size: int = settings.ACTIVE_PROJECTS_BATCH_SIZE,
+        newest_first: bool = False,
+    ) -> Iterator[list[Project]]:
+        """Stream active projects in keyset-paginated batches ordered by id.
+        
+        Every batch is a short `WHERE id > last_id ORDER BY id LIMIT n` query
+        on the partial index `ix_projects_queue`, so memory stays flat and
+        status updates committed between batches don't shift later pages.
+        
+        Args:
+            batch_size: Projects per batch
+            newest_first: Order by id descending
+        """
+        last_id = None
+        
+        while True:
+            stmt = (
+                select(Project)
+                .where(due_projects_clause())
+                .order_by(Project.id.desc() if newest_first else Project.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                stmt = stmt.where(Project.id < last_id if newest_first else Project.id > last_id)
+            
+            try:
+                batch = list(self.session.scalars(stmt).all())
+            except Exception as e:
+                logger.error(f"Failed to get active projects batch: {e}")
+                raise DatabaseError(f"Failed to get active projects: {e}") from e
+            
+            if not batch:
+                return
+            
+            yield batch
+            
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].id
+    
+    def claim_projects(
+        self,
+        worker_id: str,
+        marketplace: MarketplaceEnum,
+        limit: int = settings.WORKER_CLAIM_BATCH,
+        lease_seconds: float = settings.WORKER_LEASE_SECONDS,
+        newest_first: bool = False,
+        after_id: Optional[int] = None,
+    ) -> list[Project]:
+        """Atomically lease up to `limit` due active projects to a worker.
+        
+        Candidates are locked with SELECT ... FOR UPDATE SKIP LOCKED, so
+        concurrent workers never wait for or get the same rows. A project
+        whose lease expired (worker died) can be claimed again.
+        
+        Args:
+            worker_id: Unique id of the claiming worker
+            marketplace: Only claim projects of this marketplace
+            limit: Max projects to claim
+            lease_seconds: Lease duration
+            newest_first: Claim by id descending
+            after_id: Only claim projects after this id in claim order (keyset pagination)
+            
+        Returns:
+            Claimed projects in claim order
+        """
+        now = datetime.now(timezone.utc)
+        candidates = (
+            select(Project.id)
+            .where(due_projects_clause(now))
+            .where(Project.marketplace == marketplace)
+            .order_by(Project.id.desc() if newest_first else Project.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if after_id is not None:
+            candidates = candidates.where(Project.id < after_id if newest_first else Project.id > after_id)
+        
+        try:
+            projects = list(self.session.scalars(
+                update(Project)
+                .where(Project.id.in_(candidates.scalar_subquery()))
+                .values(claimed_by=worker_id, lease_expires_at=now + timedelta(seconds=lease_seconds))
+                .returning(Project),
+                execution_options={"synchronize_session": False}
+            ).all())
+            self.session.commit()
+            
+            if projects:
+                logger.info(f"Worker {worker_id} claimed {len(projects)} projects")
+            return sorted(projects, key=lambda project: project.id, reverse=newest_first)
+            
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to claim projects for {worker_id}: {e}")
+            raise DatabaseError(f"Failed to claim projects: {e}") from e
+    
+    def extend_lease(self, project_ids: list[int], worker_id: str, lease_seconds: float = settings.WORKER_LEASE_SECONDS) -> int:
+        """Extend worker's leases (heartbeat for long running projects).
+        
+        Returns:
+            Number of leases extended (leases taken over by others are not)
+        """
+        try:
+            result = self.session.execute(
+                update(Project)
+                .where(Project.id.in_(project_ids))
+                .where(Project.claimed_by == worker_id)
+                .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)),
+                execution_options={"synchronize_session": False}
+            )
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to extend leases for {worker_id}: {e}")
+            raise DatabaseError(f"Failed to extend leases: {e}") from e
+    
+    def release_projects(self, project_ids: list[int], worker_id: str) -> int:
+        """Release worker's leases, so other workers can claim the projects if still active."""
+        try:
+            result = self.session.execute(
+                update(Project)
+                .where(Project.id.in_(project_ids))
+                .where(Project.claimed_by == worker_id)
+                .values(claimed_by=None, lease_expires_at=None),
+                execution_options={"synchronize_session": False}
+            )
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to release projects for {worker_id}: {e}")
+            raise DatabaseError(f"Failed to release projects: {e}") from e
+    
     def create(self, project_data: CreateProjectSchema) -> Project:
         """Create a new project."""
         try:
@@ -83,15 +309,54 @@ class ProjectRepository(BaseRepository[Project]):
             raise DatabaseError(f"Failed to create project: {e}") from e
     
     def create_many(self, projects_data: list[CreateProjectSchema]) -> list[Project]:
-        """Create multiple projects at once."""
+        """Create multiple projects at once, skipping links that already exist.
+        
+        On PostgreSQL and SQLite this is a single
+        INSERT ... ON CONFLICT (link) DO NOTHING RETURNING statement.
+        """
+        # Drop links repeated in this batch
+        rows_by_link = {}
+        for project_data in projects_data:
+            rows_by_link.setdefault(project_data.link, project_data.model_dump())
+        rows = list(rows_by_link.values())
+        
+        if not rows:
+            return []
+        
+        insert = UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if insert is None:
+            return self._create_many_one_by_one(projects_data)
+        
+        try:
+            stmt = (
+                insert(Project)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[Project.link])
+                .returning(Project)
+            )
+            created_projects = list(self.session.scalars(stmt).all())
+            self.session.commit()
+            
+            logger.info(f"Created {len(created_projects)} projects ({len(rows) - len(created_projects)} already existed)")
+            return created_projects
+            
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to create projects batch: {e}")
+            raise DatabaseError(f"Failed to create projects: {e}") from e
+    
+    def _create_many_one_by_one(self, projects_data: list[CreateProjectSchema]) -> list[Project]:
+        """Create multiple projects with ORM add() (dialects without ON CONFLICT)."""
         created_projects = []
+        existing_links = self.get_existing_links(project_data.link for project_data in projects_data)
         
         for project_data in projects_data:
             try:
-                # Check if already exists
-                if self.get_by_link(project_data.link):
+                # Check if already exists (or repeated in this batch)
+                if project_data.link in existing_links:
                     logger.debug(f"Project with link {project_data.link} already exists, skipping")
                     continue
+                existing_links.add(project_data.link)
                 
                 project = Project(**project_data.model_dump())
                 self.session.add(project)
@@ -141,6 +406,44 @@ class ProjectRepository(BaseRepository[Project]):
             logger.error(f"Failed to update project {project_id}: {e}")
             raise DatabaseError(f"Failed to update project: {e}") from e
     
+    def update_many(self, updates: dict[int, dict]) -> int:
+        """Apply column values to many projects in one transaction.
+        
+        Rows with the same set of columns are sent as one executemany
+        UPDATE ... WHERE id = ?. Updates of projects that no longer exist
+        are logged and dropped.
+        
+        Args:
+            updates: Dict of project id -> column values
+            
+        Returns:
+            Number of projects updated
+        """
+        project_ids = list(updates)
+        
+        try:
+            existing_ids = set()
+            for start in range(0, len(project_ids), LINKS_CHUNK_SIZE):
+                chunk = project_ids[start:start + LINKS_CHUNK_SIZE]
+                existing_ids.update(self.session.scalars(select(Project.id).where(Project.id.in_(chunk))))
+            
+            missing_ids = updates.keys() - existing_ids
+            if missing_ids:
+                logger.warning(f"Dropping updates of {len(missing_ids)} deleted projects: {sorted(missing_ids)}")
+            
+            batches = group_updates(updates, existing_ids)
+            for rows in batches.values():
+                self.session.execute(UPDATE_BY_ID, rows)
+            self.session.commit()
+            
+            logger.info(f"Updated {len(existing_ids)} projects in {len(batches)} batches")
+            return len(existing_ids)
+            
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to update projects batch: {e}")
+            raise DatabaseError(f"Failed to update projects: {e}") from e
+    
     def delete(self, id: int) -> bool:
         """Delete project by ID."""
         try:
@@ -0,0 +1,183 @@
+"""Write-behind buffer for project status updates."""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from db.repositories.project_repository import ProjectRepository
+from schemas.project import UpdateProjectSchema
+from core.config import settings
+from core.exceptions import DatabaseError
+from core.loggers import db_logger as logger
+
+
+# Durability modes:
+#   immediate - every update is written before add() returns
+#   buffered  - updates live in memory until flush, a crash loses them
+#   journal   - updates are fsync'ed to a journal file first and replayed on start
+UPDATE_MODES = ("immediate", "buffered", "journal")
+
+
+class ProjectUpdateBuffer:
+    """Coalesces project updates and writes them as executemany batches.
+
+    Updates of the same project are merged (later values win). Pending
+    updates are flushed when `batch_size` projects are pending, when the
+    oldest pending update is `flush_interval` seconds old, and on `close()`.
+    Thread-safe: one buffer can be shared by parallel workers.
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], ProjectRepository],
+        mode: str = settings.STATUS_UPDATES_MODE,
+        batch_size: int = settings.STATUS_UPDATES_BATCH_SIZE,
+        flush_interval: float = settings.STATUS_UPDATES_FLUSH_INTERVAL,
+        journal_path: str = settings.STATUS_UPDATES_JOURNAL,
+    ):
+        """Initialize update buffer.
+
+        Args:
+            repository_factory: Creates a repository with a new DB session
+            mode: Durability mode, one of UPDATE_MODES
+            batch_size: Flush when this many projects have pending updates
+            flush_interval: Flush when the oldest pending update is this old (seconds)
+            journal_path: Journal file used in "journal" mode
+        """
+        if mode not in UPDATE_MODES:
+            raise ValueError(f"Unknown status updates mode {mode!r}, expected one of {UPDATE_MODES}")
+
+        self.repository = repository_factory()
+        self.mode = mode
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.journal_path = Path(journal_path)
+
+        self._pending: dict[int, dict] = {}
+        self._first_pending_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._journal = None
+        self._flusher = None
+
+        if self.mode == "journal":
+            self._replay_journal()
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+        if self.mode != "immediate" and self.flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="update-flusher", daemon=True)
+            self._flusher.start()
+
+    def _replay_journal(self) -> None:
+        """Apply updates left in journal by a previous run."""
+        if not self.journal_path.exists():
+            return
+
+        updates: dict[int, dict] = {}
+        with open(self.journal_path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                    update_data = UpdateProjectSchema.model_validate(entry["values"])
+                except ValueError:
+                    # Torn last line after a crash
+                    continue
+                updates.setdefault(entry["id"], {}).update(
+                    update_data.model_dump(exclude_none=True, exclude_unset=True)
+                )
+
+        if updates:
+            logger.info(f"Replaying {len(updates)} journaled project updates")
+            self.repository.update_many(updates)
+        self.journal_path.unlink()
+
+    def _write_journal(self, project_id: int, update_data: UpdateProjectSchema) -> None:
+        values = update_data.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+        self._journal.write(json.dumps({"id": project_id, "values": values}) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def add(self, project_id: int, update_data: UpdateProjectSchema) -> None:
+        """Queue an update of one project.
+
+        Args:
+            project_id: Project to update
+            update_data: Fields to change (unset and None fields are ignored)
+        """
+        values = update_data.model_dump(exclude_none=True, exclude_unset=True)
+        if not values:
+            return
+
+        with self._lock:
+            if self._journal is not None:
+                self._write_journal(project_id, update_data)
+
+            self._pending.setdefault(project_id, {}).update(values)
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+
+            if self.mode == "immediate" or len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> int:
+        """Write all pending updates now.
+
+        Returns:
+            Number of projects updated
+
+        Raises:
+            DatabaseError: If the batch failed (updates stay pending)
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+
+            updates = self._pending
+            self._pending = {}
+            self._first_pending_at = None
+
+            try:
+                count = self.repository.update_many(updates)
+            except DatabaseError:
+                # Keep failed updates, newer values for the same project win
+                for project_id, values in updates.items():
+                    self._pending[project_id] = {**values, **self._pending.get(project_id, {})}
+                self._first_pending_at = time.monotonic()
+                raise
+
+            if self._journal is not None and not self._pending:
+                self._journal.truncate(0)
+                self._journal.seek(0)
+
+            return count
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(min(self.flush_interval, 1.0)):
+            with self._lock:
+                due = (
+                    self._first_pending_at is not None
+                    and time.monotonic() - self._first_pending_at >= self.flush_interval
+                )
+                if due:
+                    try:
+                        self.flush()
+                    except DatabaseError as e:
+                        logger.error(f"Background flush of project updates failed: {e}")
+
+    def close(self) -> None:
+        """Flush pending updates and stop background flushing."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+
+        try:
+            self.flush()
+        finally:
+            if self._journal is not None:
+                self._journal.close()
+                if not self._pending:
+                    self.journal_path.unlink(missing_ok=True)
+            self.repository.session.close()
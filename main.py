@@ -1,19 +1,37 @@
 """Main application entry point."""
+import argparse
 import logging
+import os
+import socket
+import time
 
-from auth import get_authenticator
+from ai.prefilter import KeywordPreFilter
+from auth import AuthenticatorFactory, get_authenticator
+from core.config import settings
 from core.container import Container
 from core.loggers import freelancehunt_logger, freelancer_logger
 from core.exceptions import AuthenticationError, ScrapingError, DatabaseError
+from core.scheduler import AdaptivePollScheduler
 from schemas.project import MarketplaceEnum
 from services import ProjectService
 from scraper import get_scraper
+from scraper.prefetcher import ProjectPagePrefetcher
+
+
+MARKETPLACE_LOGGERS = {
+    MarketplaceEnum.FREELANCEHUNT: freelancehunt_logger,
+    MarketplaceEnum.FREELANCER: freelancer_logger,
+}
 
 
 class Application:
     def __init__(self, container: Container):
         self.container = container
         self.container.start_db()
+        self.authenticators: dict[MarketplaceEnum, AuthenticatorFactory] = {}
+        self.empty_polls: dict[MarketplaceEnum, int] = {}
+        # Lease owner of projects claimed by this process
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
     
     def get_pages_range(self, tries: int = 5) -> tuple[int, int]:
         """Get pages range from user input.
@@ -61,61 +79,119 @@ class Application:
             print(f"Error parsing input: {e}")
             return self.get_pages_range(tries - 1)
     
-    def scrape_and_process_projects(
-        self, 
+    def process_active_projects(
+        self,
         service: ProjectService,
         logger: logging.Logger,
-        marketplace: MarketplaceEnum
-    ) -> None:
-        """Scrape projects and process them with bids.
+        fresh_first: bool = False
+    ) -> tuple[int, int]:
+        """Process all active projects with bids.
         
         Args:
             service: ProjectService instance
             logger: Logger for this marketplace
-            marketplace: MarketplaceEnum
+            fresh_first: Process newest projects first
+            
+        Returns:
+            Tuple of (bids placed, projects skipped)
         """
-        logger.info(f"Starting {marketplace.value} automation")
+        projects_bid_placed = 0
+        projects_skipped = 0
+        projects_found = 0
         
-        try:
-            # Scrape projects from multiple pages
-            start_page, end_page = self.get_pages_range()
-            total_scraped = 0
-            
-            for page in range(start_page, end_page):
-                try:
-                    count = service.scrape_and_save_projects(page)
-                    total_scraped += count
-                    logger.info(f"Page {page}: scraped {count} new projects")
-                except ScrapingError as e:
-                    logger.error(f"Failed to scrape page {page}: {e}")
-                    continue
+        # Claim active projects batch by batch: the first batch is processed
+        # right away, and projects leased by workers are not bid on twice
+        for projects in service.iter_claimed_project_batches(self.worker_id, newest_first=fresh_first):
+            projects_found += len(projects)
+            logger.info(f"Processing batch of {len(projects)} active projects ({projects_found} so far)")
             
-            logger.info(f"Total new projects scraped: {total_scraped}")
+            # Fetch project pages in parallel before bidding
+            pages = service.prefetch_project_pages(projects)
             
-            # Get active projects and process them
-            projects = service.get_active_projects()
-            logger.info(f"Found {len(projects)} active projects to process")
+            if settings.BROWSER_POOL_SIZE > 1:
+                results = service.process_projects_parallel(
+                    projects,
+                    pool=self.container.browser_pool,
+                    repository_factory=lambda: self.container.project_repository,
+                    pages=pages
+                )
+                batch_bid_placed = sum(1 for is_bid_placed in results.values() if is_bid_placed)
+                projects_bid_placed += batch_bid_placed
+                projects_skipped += len(results) - batch_bid_placed
+                continue
             
-            projects_bid_placed = 0
-            projects_skipped = 0
+            if settings.AI_ASYNC_ENABLED:
+                # AI answers are generated while the browser checks next pages
+                results = service.process_projects_pipelined(
+                    projects,
+                    async_ai=self.container.async_ai,
+                    pages=pages
+                )
+                batch_bid_placed = sum(1 for is_bid_placed in results.values() if is_bid_placed)
+                projects_bid_placed += batch_bid_placed
+                projects_skipped += len(results) - batch_bid_placed
+                continue
             
             for project in projects:
                 try:
-                    is_bid_placed = service.process_project(project)
-                    
+                    is_bid_placed = service.process_project(project, page=pages.get(project.id))
+                
                     if is_bid_placed:
                         logger.info(f"✓ Bid placed: {project.title}")
                         projects_bid_placed += 1
                     else:
                         logger.info(f"⊗ Bid skipped: {project.title}")
                         projects_skipped += 1
-                        
+                    
                 except DatabaseError as e:
                     logger.error(f"Database error for {project.title}: {e}")
                     continue
                 except Exception as e:
                     logger.error(f"Unexpected error for {project.title}: {e}", exc_info=True)
                     continue
+        
+        logger.info(f"Processed {projects_found} active projects")
+        if service.prefilter is not None:
+            logger.info(f"AI pre-filter: {service.prefilter.stats}")
+        return projects_bid_placed, projects_skipped
+    
+    def scrape_and_process_projects(
+        self, 
+        service: ProjectService,
+        logger: logging.Logger,
+        marketplace: MarketplaceEnum
+    ) -> None:
+        """Scrape projects and process them with bids.
+        
+        Args:
+            service: ProjectService instance
+            logger: Logger for this marketplace
+            marketplace: MarketplaceEnum
+        """
+        logger.info(f"Starting {marketplace.value} automation")
+        
+        try:
+            # Scrape projects from multiple pages
+            total_scraped = 0
+            
+            if settings.CRAWL_MODE == "incremental":
+                total_scraped = service.scrape_new_projects()
+            else:
+                start_page, end_page = self.get_pages_range()
+                
+                for page in range(start_page, end_page):
+                    try:
+                        count = service.scrape_and_save_projects(page)
+                        total_scraped += count
+                        logger.info(f"Page {page}: scraped {count} new projects")
+                    except ScrapingError as e:
+                        logger.error(f"Failed to scrape page {page}: {e}")
+                        continue
+            
+            logger.info(f"Total new projects scraped: {total_scraped}")
+            
+            # Get active projects and process them
+            projects_bid_placed, projects_skipped = self.process_active_projects(service, logger)
             
             # Summary
             logger.info("=" * 50)
@@ -129,19 +205,39 @@ class Application:
             logger.error(f"Critical error in {marketplace.value} automation: {e}", exc_info=True)
             raise
     
+    def create_service(self, marketplace: MarketplaceEnum) -> ProjectService:
+        """Log in to marketplace and build its ProjectService.
+        
+        Raises:
+            AuthenticationError: If login fails
+        """
+        # Authenticate
+        authenticator = get_authenticator(marketplace, self.container.browser)
+        authenticator.login()
+        self.authenticators[marketplace] = authenticator
+        
+        # In "http" mode read-only pages go through HTTP with the session cookies
+        http_client = self.container.get_http_client(marketplace) if settings.SCRAPER_FETCH_MODE == "http" else None
+        scraper = get_scraper(marketplace, self.container.browser, http_client)
+        prefetcher = None
+        if settings.PREFETCH_PROJECT_PAGES:
+            prefetcher = ProjectPagePrefetcher(scraper, self.container.get_http_client(marketplace))
+        return ProjectService(
+            repository=self.container.project_repository,
+            scraper=scraper,
+            prefetcher=prefetcher,
+            crawl_state_repository=self.container.crawl_state_repository,
+            link_index=self.container.link_index if settings.KNOWN_LINKS_INDEX else None,
+            update_buffer=self.container.update_buffer,
+            prefilter=KeywordPreFilter() if settings.AI_PREFILTER_ENABLED else None
+        )
+    
     def run(self, marketplace: MarketplaceEnum, logger: logging.Logger) -> None:
         """Run full automation for all marketplaces."""
         try:
-            # Authenticate
-            authenticator = get_authenticator(marketplace, self.container.browser)
-            authenticator.login()
+            service = self.create_service(marketplace)
             
             # Process projects
-            scraper = get_scraper(marketplace, self.container.browser)
-            service = ProjectService(
-                repository=self.container.project_repository,
-                scraper=scraper
-            )
             self.scrape_and_process_projects(
                 service=service,
                 logger=logger,
@@ -153,16 +249,148 @@ class Application:
         except Exception as e:
             logger.error(f"{marketplace.value} automation failed: {e}", exc_info=True)
             raise
+    
+    def check_session(self, marketplace: MarketplaceEnum, logger: logging.Logger) -> None:
+        """Log in again if the marketplace session has expired.
+        
+        Called after a poll whose first listing page failed or was empty.
+        Logs in again when the browser is logged out or after
+        SESSION_EMPTY_POLLS_TO_RELOGIN such polls in a row, then refreshes
+        cookies of the marketplace HTTP client.
+        """
+        self.empty_polls[marketplace] = self.empty_polls.get(marketplace, 0) + 1
+        authenticator = self.authenticators[marketplace]
+        
+        if authenticator.is_authenticated():
+            if self.empty_polls[marketplace] < settings.SESSION_EMPTY_POLLS_TO_RELOGIN:
+                # Browser session is fine, HTTP client may carry outdated cookies
+                self.container.refresh_http_client(marketplace)
+                return
+            logger.warning(f"{self.empty_polls[marketplace]} polls in a row got an empty listing")
+        else:
+            logger.warning(f"{marketplace.value} session expired")
+        
+        authenticator.relogin()
+        self.empty_polls[marketplace] = 0
+        self.container.refresh_http_client(marketplace)
+    
+    def poll_marketplace(self, service: ProjectService, logger: logging.Logger) -> int:
+        """Run one daemon cycle: incremental crawl, then bid on due projects, newest first.
+        
+        Returns:
+            Number of new projects found
+        """
+        marketplace = service.scraper.marketplace_enum
+        
+        with self.container.session_scope():
+            try:
+                new_projects = service.scrape_new_projects()
+                logger.info(f"Poll found {new_projects} new projects")
+                if service.last_crawl_empty:
+                    self.check_session(marketplace, logger)
+                else:
+                    self.empty_polls[marketplace] = 0
+                if service.link_index is not None:
+                    logger.info(f"Link index: {service.link_index.stats}")
+                
+                # Also in quiet periods: retries whose next_attempt_at has passed are due now
+                projects_bid_placed, projects_skipped = self.process_active_projects(
+                    service, logger, fresh_first=True
+                )
+                if projects_bid_placed or projects_skipped:
+                    logger.info(f"Bids placed: {projects_bid_placed}, skipped: {projects_skipped}")
+                
+                return new_projects
+                
+            except Exception as e:
+                logger.error(f"Poll failed: {e}", exc_info=True)
+                return 0
+    
+    def run_daemon(self, marketplaces: list[MarketplaceEnum]) -> None:
+        """Poll marketplaces until interrupted, on an adaptive schedule.
+        
+        Browser, login and DB connections are created once and kept warm
+        between polls.
+        
+        Args:
+            marketplaces: Marketplaces to poll
+        """
+        services = {}
+        schedulers = {}
+        next_polls = {}
+        
+        for marketplace in marketplaces:
+            services[marketplace] = self.create_service(marketplace)
+            schedulers[marketplace] = AdaptivePollScheduler()
+            next_polls[marketplace] = time.monotonic()
+        
+        while True:
+            marketplace = min(next_polls, key=next_polls.get)
+            wait = next_polls[marketplace] - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            
+            logger = MARKETPLACE_LOGGERS[marketplace]
+            new_projects = self.poll_marketplace(services[marketplace], logger)
+            
+            interval = schedulers[marketplace].record(new_projects)
+            next_polls[marketplace] = time.monotonic() + interval
+            logger.info(f"Next {marketplace.value} poll in {interval:.0f}s")
+    
+    def run_worker(self, marketplace: MarketplaceEnum) -> None:
+        """Process the shared project queue until interrupted.
+        
+        Several workers (processes or containers) can run against the same
+        database; projects are claimed with leases, so none is bid on twice.
+        
+        Args:
+            marketplace: Marketplace whose projects to process
+        """
+        logger = MARKETPLACE_LOGGERS[marketplace]
+        worker_id = self.worker_id
+        service = self.create_service(marketplace)
+        logger.info(f"Worker {worker_id} started")
+        
+        while True:
+            with self.container.session_scope():
+                try:
+                    claimed, bids_placed = service.process_claimed_projects(worker_id)
+                except DatabaseError as e:
+                    logger.error(f"Worker {worker_id} database error: {e}")
+                    claimed = 0
+            
+            if claimed:
+                logger.info(f"Worker {worker_id}: {bids_placed}/{claimed} bids placed")
+            else:
+                time.sleep(settings.WORKER_IDLE_SLEEP)
 
 
 def main():
     """Application entry point."""
+    parser = argparse.ArgumentParser(description="Freelance Automizer")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="poll marketplaces continuously (DAEMON_MARKETPLACES) instead of a single run"
+    )
+    parser.add_argument(
+        "--worker",
+        choices=[marketplace.value for marketplace in MarketplaceEnum],
+        help="process the shared project queue of a marketplace (several workers can run at once)"
+    )
+    args = parser.parse_args()
+    
     container = Container()
     app = Application(container)
     
     try:
-        app.run(MarketplaceEnum.FREELANCEHUNT, freelancehunt_logger)
-        #  app.run(MarketplaceEnum.FREELANCER, freelancer_logger) # ! TODO Потрібно реалізувати селектори 
+        if args.worker:
+            app.run_worker(MarketplaceEnum(args.worker))
+        elif args.daemon:
+            app.run_daemon([MarketplaceEnum(value) for value in settings.DAEMON_MARKETPLACES])
+        else:
+            app.run(MarketplaceEnum.FREELANCEHUNT, freelancehunt_logger)
+            #  app.run(MarketplaceEnum.FREELANCER, freelancer_logger) # ! TODO Потрібно реалізувати селектори 
     except KeyboardInterrupt:
         print("\n\nAutomation interrupted by user")
     except Exception as e:
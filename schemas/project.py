@@ -1,13 +1,39 @@
 from __future__ import annotations
 
+from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class MarketplaceEnum(Enum):
     FREELANCEHUNT = "freelancehunt"
     FREELANCER = "freelancer"
-    
+
+
+class ProjectStatusEnum(Enum):
+    NEW = "new"                          # scraped from listing
+    DETAILS_FETCHED = "details_fetched"  # description stored, AI verdict known, bid not submitted yet
+    AI_PENDING = "ai_pending"            # description stored, waiting for AI response (retry at next_attempt_at)
+    AI_REJECTED = "ai_rejected"          # AI decided not to bid
+    BID_FAILED = "bid_failed"            # bid submission failed (retry at next_attempt_at)
+    BID_PLACED = "bid_placed"
+    SKIPPED = "skipped"                  # bidding not possible or attempts exhausted
+
+
+class AIVerdictEnum(Enum):
+    ACCEPTED = "accepted"
+    REJECTED = "rejected"
+
+
+# Statuses still waiting for a bid decision
+ACTIVE_STATUSES = (
+    ProjectStatusEnum.NEW,
+    ProjectStatusEnum.DETAILS_FETCHED,
+    ProjectStatusEnum.AI_PENDING,
+    ProjectStatusEnum.BID_FAILED,
+)
+
+
 class ProjectSchema(BaseModel):
     id: int
     title: str
@@ -18,8 +44,15 @@ class ProjectSchema(BaseModel):
 
     bid_message: str|None = None
 
-    is_bid_placed: bool = False
-    is_bid_skipped: bool = False
+    description: str|None = None
+    description_hash: str|None = None
+    ai_verdict: AIVerdictEnum|None = None
+
+    status: ProjectStatusEnum = ProjectStatusEnum.NEW
+    attempts: int = 0
+    created_at: datetime|None = None
+    processed_at: datetime|None = None
+    next_attempt_at: datetime|None = None
 
 
 class CreateProjectSchema(BaseModel):
@@ -29,12 +62,19 @@ class CreateProjectSchema(BaseModel):
     currency: str
     marketplace: MarketplaceEnum
 
-    is_bid_placed: bool = False
-    is_bid_skipped: bool = False
+    status: ProjectStatusEnum = ProjectStatusEnum.NEW
+
+    # Scraped from listing only, not stored in DB
+    bids: int|None = Field(default=None, exclude=True)
 
 
 class UpdateProjectSchema(BaseModel):
-    is_bid_placed: bool|None = None
-    is_bid_skipped: bool|None = None
+    status: ProjectStatusEnum|None = None
     bid_message: str|None = None
+    description: str|None = None
+    description_hash: str|None = None
+    ai_verdict: AIVerdictEnum|None = None
+    attempts: int|None = None
+    processed_at: datetime|None = None
+    next_attempt_at: datetime|None = None
 
@@ -8,8 +8,8 @@ SCRAPERS = {
     MarketplaceEnum.FREELANCER: FreelancerProjectsScraper,
 }
 
-def get_scraper(marketplace: MarketplaceEnum, browser) -> ProjectsScraperFactory:
+def get_scraper(marketplace: MarketplaceEnum, browser, http_client=None) -> ProjectsScraperFactory:
     scraper_class = SCRAPERS.get(marketplace)
     if not scraper_class:
         raise ValueError(f"Unknown marketplace: {marketplace}")
-    return scraper_class(browser)
\ No newline at end of file
+    return scraper_class(browser, http_client)
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Base scraper interfaces."""
 from abc import ABC, abstractmethod
 from typing import Optional
+import json
 import re
 
 from selenium.webdriver.remote.webelement import WebElement
@@ -9,8 +10,11 @@ from selenium.common.exceptions import NoSuchElementException
 from db.models import Project
 from schemas.project import CreateProjectSchema, MarketplaceEnum
 from utils.helpers import remove_markup
+from scraper.parser import HtmlSnapshotParser
+from scraper.page import ProjectPage
 from core.config import settings
 from core.browser import Browser
+from core.http_client import HttpClient
 from core.exceptions import (
     ElementNotFoundError, 
     ParsingError, 
@@ -19,20 +23,88 @@ from core.exceptions import (
 )
 
 
+# Collects title, link, price and bids of every listing row in a single
+# WebDriver round trip. Locators are passed as [by, value] pairs.
+BULK_EXTRACT_PROJECTS_SCRIPT = """
+const [rowsLocator, titleLocator, priceLocator, bidsLocator] = arguments;
+
+function findAll(locator, context) {
+    const [by, value] = locator;
+    if (by === "xpath") {
+        const result = document.evaluate(
+            value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const nodes = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    if (by === "id") {
+        return Array.from(context.querySelectorAll("#" + CSS.escape(value)));
+    }
+    if (by === "class name") {
+        return Array.from(context.querySelectorAll("." + CSS.escape(value)));
+    }
+    if (by === "name") {
+        return Array.from(context.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+    }
+    if (by === "css selector" || by === "tag name") {
+        return Array.from(context.querySelectorAll(value));
+    }
+    if (by === "link text" || by === "partial link text") {
+        return Array.from(context.querySelectorAll("a")).filter(link => {
+            const text = link.innerText.trim();
+            return by === "link text" ? text === value : text.includes(value);
+        });
+    }
+    // Python side falls back to per-element parsing
+    throw new Error("Unsupported locator strategy: " + by);
+}
+
+function findOne(locator, context) {
+    return findAll(locator, context)[0] || null;
+}
+
+const rows = findAll(rowsLocator, document).map(row => {
+    const title = findOne(titleLocator, row);
+    const price = findOne(priceLocator, row);
+    const bids = findOne(bidsLocator, row);
+    return {
+        title: title ? title.innerText : null,
+        link: title ? title.href : null,
+        price: price ? price.innerHTML : null,
+        bids: bids ? bids.innerText : null
+    };
+});
+
+return JSON.stringify(rows);
+"""
+
+
 class ProjectsScraperFactory(ABC):
     """Base class for project scrapers with common implementation."""
     
-    def __init__(self, browser: Browser):
+    def __init__(self, browser: Browser, http_client: Optional[HttpClient] = None):
         """Initialize scraper with browser instance.
         
         Args:
-            browser: Browser instance with initialized driver
+            browser: Browser instance with initialized driver, or None
+                for offline parsing of stored HTML (parse_* methods only)
+            http_client: Optional HTTP client with browser session cookies;
+                if set, read-only pages are fetched over HTTP and only
+                submit_bid uses the browser
         """
         self.browser = browser
-        self.driver = browser.driver
+        self.http_client = http_client
+        self.driver = browser.driver if browser is not None else None
         
-        if not self.driver:
+        if browser is not None and not self.driver:
             raise ValueError("Driver is not initialized")
+        
+        self._parser = None
+        # (project link, browser URL) of the bid form opened by open_bid_form
+        self._bid_form = None
     
     @property
     @abstractmethod
@@ -64,19 +136,98 @@ class ProjectsScraperFactory(ABC):
         """
         pass
     
-    def _extract_price(self, row: WebElement) -> tuple[int, str]:
-        """Extract price and currency from project row.
+    @property
+    def parser(self) -> HtmlSnapshotParser:
+        """Get offline HTML parser for this marketplace's selectors."""
+        if self._parser is None:
+            self._parser = HtmlSnapshotParser(
+                self.projects_selector_class,
+                self.project_selector_class
+            )
+        return self._parser
+    
+    @property
+    def uses_html_parser(self) -> bool:
+        """Whether pages are parsed from HTML snapshots instead of live DOM."""
+        return self.http_client is not None or settings.SCRAPER_PARSER_BACKEND == "lxml"
+    
+    def _load_html(self, url: str) -> tuple[str, str]:
+        """Load page and return its HTML snapshot.
+        
+        Fetched over HTTP if http_client is set, otherwise loaded in the browser.
         
         Args:
-            row: WebElement containing project row
+            url: Page URL
+            
+        Returns:
+            Tuple of (html, final_url)
+        """
+        if self.http_client is not None:
+            response = self.http_client.get(url)
+            return response.text, str(response.url)
+        
+        self._open_in_browser(url)
+        return self.driver.page_source, self.driver.current_url
+    
+    def _open_in_browser(self, url: str) -> None:
+        """Load read-only page in the browser (lean mode if enabled)."""
+        with self.browser.lean():
+            self.browser.open(url)
+    
+    def parse_projects_html(self, html: str, base_url: str = "") -> list[CreateProjectSchema]:
+        """Parse projects from listing page HTML without a browser.
+        
+        Args:
+            html: Listing page HTML
+            base_url: URL of the page, used to resolve relative links
+            
+        Returns:
+            List of CreateProjectSchema (not saved to DB)
+        """
+        return self._build_projects(self.parser.parse_project_rows(html, base_url))
+    
+    def parse_project_details_html(self, project: Project, html: str) -> dict:
+        """Parse project details from project page HTML without a browser.
+        
+        Args:
+            project: Project model
+            html: Project page HTML
+            
+        Returns:
+            Dictionary with project details
+            
+        Raises:
+            ElementNotFoundError: If description is not found
+        """
+        description_html = self.parser.parse_description_html(html)
+        if description_html is None:
+            raise ElementNotFoundError("Project description not found")
+        
+        return {
+            "description": remove_markup(description_html),
+            "link": project.link,
+            "title": project.title
+        }
+    
+    def parse_bid_status_html(self, html: str) -> dict:
+        """Parse bid status from project page HTML without a browser.
+        
+        Returns:
+            Dictionary with status info (see check_bid_status)
+        """
+        return self.parser.parse_bid_status(html)
+    
+    def _parse_price(self, price_text: str) -> tuple[int, str]:
+        """Parse price and currency from raw price text.
+        
+        Args:
+            price_text: Price cell content, e.g. "5 000 UAH"
             
         Returns:
             Tuple of (price, currency)
         """
         try:
-            ProjectsSelector = self.projects_selector_class
-            price_text = row.find_element(*ProjectsSelector.PRICE).get_attribute("innerHTML").strip()
-            *prices, currency = price_text.split()
+            *prices, currency = price_text.strip().split()
             price = "".join(prices)
             return int(price), currency
         except Exception as e:
@@ -86,29 +237,101 @@ class ProjectsScraperFactory(ABC):
                 logger.warning("Failed to extract price, using default")
             return settings.DEFAULT_PRICE_UAH, "UAH"
     
-    def scrape_projects_list(self, page: int = 1) -> list[CreateProjectSchema]:
-        """Scrape projects from listing page.
+    def _parse_bids(self, bids_text: Optional[str]) -> Optional[int]:
+        """Parse bids count from raw bids text (e.g. "12 ставок")."""
+        if not bids_text:
+            return None
+        match = re.search(r"\d+", bids_text)
+        return int(match.group()) if match else None
+    
+    def _extract_price(self, row: WebElement) -> tuple[int, str]:
+        """Extract price and currency from project row.
         
         Args:
-            page: Page number to scrape
+            row: WebElement containing project row
             
         Returns:
-            List of CreateProjectSchema (not saved to DB)
+            Tuple of (price, currency)
+        """
+        try:
+            ProjectsSelector = self.projects_selector_class
+            price_text = row.find_element(*ProjectsSelector.PRICE).get_attribute("innerHTML")
+        except Exception:
+            price_text = ""
+        return self._parse_price(price_text)
+    
+    def _extract_projects_bulk(self, page: int) -> list[CreateProjectSchema]:
+        """Extract all project rows of the loaded listing page with one script call.
+        
+        Args:
+            page: Page number (for logging)
+            
+        Returns:
+            List of CreateProjectSchema
         """
         ProjectsSelector = self.projects_selector_class
         logger = getattr(self, 'logger', None)
         
-        try:
-            url = self.get_projects_page_url(page)
-            if logger:
-                logger.info(f"Scraping projects from page {page}: {url}")
-            self.driver.get(url)
+        payload = self.driver.execute_script(
+            BULK_EXTRACT_PROJECTS_SCRIPT,
+            list(ProjectsSelector.ALL_PROJECTS),
+            list(ProjectsSelector.TITLE),
+            list(ProjectsSelector.PRICE),
+            list(ProjectsSelector.BIDS),
+        )
+        rows = json.loads(payload)
+        if logger:
+            logger.info(f"Found {len(rows)} project rows on page {page}")
+        
+        return self._build_projects(rows)
+    
+    def _build_projects(self, rows: list[dict]) -> list[CreateProjectSchema]:
+        """Build project schemas from extracted row payloads.
+        
+        Args:
+            rows: List of dicts with "title", "link", "price" and "bids" keys
             
-        except Exception as e:
-            if logger:
-                logger.error(f"Failed to load page {page}: {e}")
-            raise PageLoadError(f"Failed to load projects page: {e}") from e
+        Returns:
+            List of CreateProjectSchema
+        """
+        logger = getattr(self, 'logger', None)
+        projects = []
         
+        for row in rows:
+            title = (row.get("title") or "").strip()
+            link = row.get("link")
+            
+            if not title or not link:
+                if logger:
+                    logger.warning("Empty title or link, skipping")
+                continue
+            
+            price, currency = self._parse_price(row.get("price") or "")
+            
+            projects.append(CreateProjectSchema(
+                title=title,
+                link=link,
+                price=price,
+                currency=currency,
+                marketplace=self.marketplace_enum,
+                bids=self._parse_bids(row.get("bids"))
+            ))
+        
+        return projects
+    
+    def _extract_projects_by_elements(self, page: int) -> list[CreateProjectSchema]:
+        """Extract project rows of the loaded listing page element by element.
+        
+        Fallback for pages where the bulk script can't run.
+        
+        Args:
+            page: Page number (for logging)
+            
+        Returns:
+            List of CreateProjectSchema
+        """
+        ProjectsSelector = self.projects_selector_class
+        logger = getattr(self, 'logger', None)
         projects = []
         
         try:
@@ -151,6 +374,58 @@ class ProjectsScraperFactory(ABC):
                     logger.error(f"Unexpected error parsing project: {e}", exc_info=True)
                 continue
         
+        return projects
+    
+    def scrape_projects_list(self, page: int = 1) -> list[CreateProjectSchema]:
+        """Scrape projects from listing page.
+        
+        Args:
+            page: Page number to scrape
+            
+        Returns:
+            List of CreateProjectSchema (not saved to DB)
+        """
+        logger = getattr(self, 'logger', None)
+        
+        try:
+            url = self.get_projects_page_url(page)
+            if logger:
+                logger.info(f"Scraping projects from page {page}: {url}")
+            if self.uses_html_parser:
+                html, current_url = self._load_html(url)
+            else:
+                self._open_in_browser(url)
+            
+        except Exception as e:
+            if logger:
+                logger.error(f"Failed to load page {page}: {e}")
+            raise PageLoadError(f"Failed to load projects page: {e}") from e
+        
+        projects = None
+        
+        if self.uses_html_parser:
+            try:
+                projects = self.parse_projects_html(html, current_url)
+                if logger:
+                    logger.info(f"Parsed {len(projects)} projects from page {page} snapshot")
+            except Exception as e:
+                if self.http_client is not None:
+                    if logger:
+                        logger.error(f"Failed to parse page {page}: {e}")
+                    raise ParsingError(f"Failed to parse projects page: {e}") from e
+                if logger:
+                    logger.warning(f"HTML snapshot parsing failed on page {page}, falling back to live DOM: {e}")
+        
+        if projects is None and settings.SCRAPER_BULK_EXTRACTION:
+            try:
+                projects = self._extract_projects_bulk(page)
+            except Exception as e:
+                if logger:
+                    logger.warning(f"Bulk extraction failed on page {page}, falling back to per-element parsing: {e}")
+        
+        if projects is None:
+            projects = self._extract_projects_by_elements(page)
+        
         if logger:
             logger.info(f"Successfully scraped {len(projects)} projects from page {page}")
         return projects
@@ -170,13 +445,28 @@ class ProjectsScraperFactory(ABC):
         try:
             if logger:
                 logger.info(f"Opening project page: {project.link}")
-            self.driver.get(project.link)
+            if self.uses_html_parser:
+                html, _ = self._load_html(project.link)
+            else:
+                self._open_in_browser(project.link)
             
         except Exception as e:
             if logger:
                 logger.error(f"Failed to load project page {project.link}: {e}")
             raise PageLoadError(f"Failed to load project page: {e}") from e
         
+        if self.uses_html_parser:
+            try:
+                return self.parse_project_details_html(project, html)
+            except ElementNotFoundError:
+                if logger:
+                    logger.error("Failed to find description element")
+                raise
+            except Exception as e:
+                if logger:
+                    logger.error(f"Failed to parse project details: {e}")
+                raise ParsingError(f"Failed to parse project details: {e}") from e
+        
         try:
             description_el = self.driver.find_element(*ProjectSelector.DESCRIPTION)
             description_html = description_el.get_attribute("innerHTML")
@@ -213,12 +503,26 @@ class ProjectsScraperFactory(ABC):
         logger = getattr(self, 'logger', None)
         
         try:
-            self.driver.get(project.link)
+            if self.uses_html_parser:
+                html, _ = self._load_html(project.link)
+            else:
+                self._open_in_browser(project.link)
         except Exception as e:
             if logger:
                 logger.error(f"Failed to load project page: {e}")
             raise PageLoadError(f"Failed to load project page: {e}") from e
         
+        if self.uses_html_parser:
+            status = self.parse_bid_status_html(html)
+            if logger:
+                if status["already_bid"]:
+                    logger.info(f"Bid already placed on {project.link}")
+                if status["no_more_bids"]:
+                    logger.info(f"No more bids allowed on {project.link}")
+                if status["too_many_bids"]:
+                    logger.warning(f"Too many bids on {project.link}")
+            return status
+        
         status = {
             "already_bid": False,
             "no_more_bids": False,
@@ -258,12 +562,123 @@ class ProjectsScraperFactory(ABC):
         
         return status
     
-    def submit_bid(self, project: Project, message: str) -> bool:
+    def open_project_page(self, project: Project) -> ProjectPage:
+        """Load project page once and snapshot everything the bidding flow needs.
+        
+        Args:
+            project: Project model
+            
+        Returns:
+            ProjectPage with bid status, description and form availability
+            
+        Raises:
+            PageLoadError: If page fails to load
+            ParsingError: If page can't be parsed
+        """
+        logger = getattr(self, 'logger', None)
+        
+        try:
+            if logger:
+                logger.info(f"Opening project page: {project.link}")
+            html, url = self._load_html(project.link)
+        except Exception as e:
+            if logger:
+                logger.error(f"Failed to load project page {project.link}: {e}")
+            raise PageLoadError(f"Failed to load project page: {e}") from e
+        
+        page = self.parse_project_page_html(project, html, url, loaded_in_browser=self.http_client is None)
+        
+        if logger:
+            logger.debug(f"Project page snapshot: {page}")
+        return page
+    
+    def parse_project_page_html(
+        self,
+        project: Project,
+        html: str,
+        url: str,
+        loaded_in_browser: bool = False
+    ) -> ProjectPage:
+        """Build project page snapshot from project page HTML without a browser.
+        
+        Args:
+            project: Project model
+            html: Project page HTML
+            url: URL the HTML was loaded from
+            loaded_in_browser: Whether the browser is currently on this page
+            
+        Returns:
+            ProjectPage with bid status, description and form availability
+            
+        Raises:
+            ParsingError: If page can't be parsed
+        """
+        logger = getattr(self, 'logger', None)
+        
+        try:
+            parsed = self.parser.parse_project_page(html)
+        except Exception as e:
+            if logger:
+                logger.error(f"Failed to parse project page {project.link}: {e}")
+            raise ParsingError(f"Failed to parse project page: {e}") from e
+        
+        description_html = parsed["description_html"]
+        return ProjectPage(
+            url=url,
+            status=parsed["status"],
+            description=remove_markup(description_html) if description_html is not None else None,
+            can_open_bid_form=parsed["can_open_bid_form"],
+            loaded_in_browser=loaded_in_browser
+        )
+    
+    def open_bid_form(self, project: Project, page: Optional[ProjectPage] = None) -> None:
+        """Open project page in the browser (if needed) and click "Place bid".
+        
+        Called by submit_bid, or in advance while the bid message is
+        still being generated.
+        
+        Args:
+            project: Project to bid on
+            page: Snapshot from open_project_page; if the browser is still
+                on that page, it is not loaded again
+            
+        Raises:
+            ElementNotFoundError: If "Place bid" button is not found
+        """
+        ProjectSelector = self.project_selector_class
+        logger = getattr(self, 'logger', None)
+        self._bid_form = None
+        
+        # Ensure we're on the fully loaded project page: a page loaded in
+        # lean mode (no CSS/images, eager) is loaded again for bidding
+        if page is not None and page.loaded_in_browser:
+            expected_url = page.url
+        else:
+            expected_url = project.link
+        if self.driver.current_url != expected_url or self.browser.lean_page:
+            self.browser.open(project.link)
+        
+        # Click "Place bid" button
+        try:
+            place_bid_button = self.driver.find_element(*ProjectSelector.PLACE_BID_BUTTON)
+            place_bid_button.click()
+            if logger:
+                logger.info("Clicked 'Place bid' button")
+        except NoSuchElementException as e:
+            if logger:
+                logger.error("Place bid button not found")
+            raise ElementNotFoundError("Place bid button not found") from e
+        
+        self._bid_form = (project.link, self.driver.current_url)
+    
+    def submit_bid(self, project: Project, message: str, page: Optional[ProjectPage] = None) -> bool:
         """Submit a bid on the project.
         
         Args:
             project: Project to bid on
             message: Bid message
+            page: Snapshot from open_project_page; if the browser is still
+                on that page, it is not loaded again
             
         Returns:
             True if bid was successfully submitted
@@ -275,20 +690,9 @@ class ProjectsScraperFactory(ABC):
         logger = getattr(self, 'logger', None)
         
         try:
-            # Ensure we're on the project page
-            if self.driver.current_url != project.link:
-                self.driver.get(project.link)
-            
-            # Click "Place bid" button
-            try:
-                place_bid_button = self.driver.find_element(*ProjectSelector.PLACE_BID_BUTTON)
-                place_bid_button.click()
-                if logger:
-                    logger.info("Clicked 'Place bid' button")
-            except NoSuchElementException as e:
-                if logger:
-                    logger.error("Place bid button not found")
-                raise ElementNotFoundError("Place bid button not found") from e
+            # Form may be already opened while AI answer was streaming
+            if self._bid_form != (project.link, self.driver.current_url):
+                self.open_bid_form(project, page)
             
             # Fill message
             try:
@@ -357,4 +761,7 @@ class ProjectsScraperFactory(ABC):
             if logger:
                 logger.error(f"Unexpected error submitting bid: {e}", exc_info=True)
             raise BidSubmissionError(f"Failed to submit bid: {e}") from e
+        finally:
+            # Form is submitted or in unknown state, open it again next time
+            self._bid_form = None
 
@@ -4,14 +4,15 @@ from schemas.project import MarketplaceEnum
 from scraper.freelancehunt.selectors import ProjectsSelector, ProjectSelector
 from core.config import settings
 from core.browser import Browser
+from core.http_client import HttpClient
 from core.loggers import freelancehunt_logger as logger
 
 
 class FreelancehuntProjectsScraper(ProjectsScraperFactory):
     """Scraper for Freelancehunt projects."""
     
-    def __init__(self, browser: Browser):
-        super().__init__(browser)
+    def __init__(self, browser: Browser, http_client: HttpClient | None = None):
+        super().__init__(browser, http_client)
         self.logger = logger
     
     @property
@@ -0,0 +1,37 @@
+"""Project page snapshot shared by the check -> describe -> bid flow."""
+from typing import Optional
+
+
+class ProjectPage:
+    """Project page loaded once and parsed in one pass.
+
+    Answers bid status, description and bid form availability
+    without navigating to the project page again.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status: dict,
+        description: Optional[str],
+        can_open_bid_form: bool,
+        loaded_in_browser: bool = True,
+    ):
+        """Initialize project page snapshot.
+
+        Args:
+            url: Browser URL after the page was loaded
+            status: Bid status dict (see ProjectsScraperFactory.check_bid_status)
+            description: Cleaned project description or None if not found
+            can_open_bid_form: Whether "Place bid" button is present
+            loaded_in_browser: False if page was fetched over HTTP, so the
+                browser still has to open it before bidding
+        """
+        self.url = url
+        self.status = status
+        self.description = description
+        self.can_open_bid_form = can_open_bid_form
+        self.loaded_in_browser = loaded_in_browser
+
+    def __repr__(self):
+        return f"ProjectPage(url={self.url}, status={self.status}, can_open_bid_form={self.can_open_bid_form})"
@@ -0,0 +1,203 @@
+"""Offline HTML parser that evaluates scraper selectors against page snapshots."""
+import re
+from typing import Optional
+from urllib.parse import urljoin
+
+from lxml import html as lxml_html
+from lxml.etree import XPath, XPathError, tostring
+from selenium.webdriver.common.by import By
+
+from core.exceptions import ParsingError
+
+TAG_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9_-]*$")
+
+
+def xpath_literal(value: str) -> str:
+    """Quote a string for XPath 1.0, which has no escape sequences.
+
+    Uses whichever quote the value doesn't contain, or concat() of both.
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def locator_to_xpath(locator: tuple[str, str]) -> str:
+    """Convert a Selenium locator into an equivalent XPath expression.
+
+    Args:
+        locator: Tuple of (By, value)
+
+    Returns:
+        XPath expression (relative to the context node, except for By.XPATH)
+
+    Raises:
+        ParsingError: If locator strategy is not supported
+    """
+    by, value = locator
+
+    # Like element.find_element(), non-XPath locators search descendants of
+    # the context node only (the whole page when evaluated on the document)
+    if by == By.XPATH:
+        return value
+    if by == By.ID:
+        return f".//*[@id={xpath_literal(value)}]"
+    if by == By.CLASS_NAME:
+        return f".//*[contains(concat(' ', normalize-space(@class), ' '), {xpath_literal(f' {value} ')})]"
+    if by == By.NAME:
+        return f".//*[@name={xpath_literal(value)}]"
+    if by == By.TAG_NAME:
+        if not TAG_NAME.match(value):
+            raise ParsingError(f"Invalid tag name: {value!r}")
+        return f".//{value}"
+    if by == By.CSS_SELECTOR:
+        try:
+            from cssselect import GenericTranslator
+        except ImportError as e:
+            raise ParsingError("cssselect is required for CSS selectors") from e
+        return GenericTranslator().css_to_xpath(value, prefix="descendant::")
+
+    raise ParsingError(f"Unsupported locator strategy: {by}")
+
+
+def inner_html(element) -> str:
+    """Return inner HTML of an lxml element (like Selenium's innerHTML)."""
+    parts = [element.text or ""]
+    parts.extend(tostring(child, encoding="unicode") for child in element)
+    return "".join(parts)
+
+
+def inner_text(element) -> str:
+    """Return whitespace-normalized text of an lxml element."""
+    return " ".join(element.text_content().split())
+
+
+class HtmlSnapshotParser:
+    """Runs marketplace selectors against a static HTML snapshot with lxml.
+
+    Works on `driver.page_source` as well as on stored HTML files,
+    so parsing doesn't need a live browser.
+    """
+
+    def __init__(self, projects_selector, project_selector):
+        """Initialize parser with marketplace selector classes.
+
+        Args:
+            projects_selector: ProjectsSelector class (listing page)
+            project_selector: ProjectSelector class (project page)
+        """
+        self.projects_selector = projects_selector
+        self.project_selector = project_selector
+        self._compiled: dict[tuple[str, str], XPath] = {}
+
+    def _xpath(self, locator: tuple[str, str]) -> XPath:
+        """Get compiled XPath for locator (cached)."""
+        compiled = self._compiled.get(locator)
+        if compiled is None:
+            try:
+                compiled = XPath(locator_to_xpath(locator))
+            except XPathError as e:
+                raise ParsingError(f"Invalid selector {locator}: {e}") from e
+            self._compiled[locator] = compiled
+        return compiled
+
+    def _find_all(self, locator: tuple[str, str], context) -> list:
+        return self._xpath(locator)(context)
+
+    def _find_one(self, locator: tuple[str, str], context) -> Optional[object]:
+        found = self._find_all(locator, context)
+        return found[0] if found else None
+
+    @staticmethod
+    def load(html: str):
+        """Parse HTML string into lxml document.
+
+        Raises:
+            ParsingError: If HTML can't be parsed
+        """
+        try:
+            return lxml_html.document_fromstring(html)
+        except Exception as e:
+            raise ParsingError(f"Failed to parse HTML: {e}") from e
+
+    def parse_project_rows(self, html: str, base_url: str = "") -> list[dict]:
+        """Extract project rows from listing page HTML.
+
+        Args:
+            html: Listing page HTML
+            base_url: URL of the page, used to resolve relative links
+
+        Returns:
+            List of dicts with "title", "link", "price" and "bids" keys
+        """
+        ProjectsSelector = self.projects_selector
+        document = self.load(html)
+        rows = []
+
+        for row in self._find_all(ProjectsSelector.ALL_PROJECTS, document):
+            title_el = self._find_one(ProjectsSelector.TITLE, row)
+            price_el = self._find_one(ProjectsSelector.PRICE, row)
+            bids_el = self._find_one(ProjectsSelector.BIDS, row)
+
+            href = title_el.get("href") if title_el is not None else None
+
+            rows.append({
+                "title": inner_text(title_el) if title_el is not None else None,
+                "link": urljoin(base_url, href) if href else None,
+                "price": inner_html(price_el) if price_el is not None else None,
+                "bids": inner_text(bids_el) if bids_el is not None else None,
+            })
+
+        return rows
+
+    def parse_description_html(self, html: str) -> Optional[str]:
+        """Extract project description inner HTML from project page HTML.
+
+        Returns:
+            Description HTML or None if not found
+        """
+        description_el = self._find_one(self.project_selector.DESCRIPTION, self.load(html))
+        if description_el is None:
+            return None
+        return inner_html(description_el)
+
+    def parse_project_page(self, html: str) -> dict:
+        """Extract everything the bidding flow needs from project page HTML.
+
+        Parses the document once and returns description, bid status and
+        bid form availability together.
+
+        Returns:
+            Dictionary with "description_html", "status" and
+            "can_open_bid_form" keys
+        """
+        document = self.load(html)
+        description_el = self._find_one(self.project_selector.DESCRIPTION, document)
+
+        return {
+            "description_html": inner_html(description_el) if description_el is not None else None,
+            "status": self._bid_status(document),
+            "can_open_bid_form": self._find_one(self.project_selector.PLACE_BID_BUTTON, document) is not None,
+        }
+
+    def parse_bid_status(self, html: str) -> dict:
+        """Extract bid status flags from project page HTML.
+
+        Returns:
+            Dictionary with "already_bid", "no_more_bids", "too_many_bids"
+            and "can_bid" keys
+        """
+        return self._bid_status(self.load(html))
+
+    def _bid_status(self, document) -> dict:
+        ProjectSelector = self.project_selector
+
+        status = {
+            "already_bid": self._find_one(ProjectSelector.ALREADY_BID, document) is not None,
+            "no_more_bids": self._find_one(ProjectSelector.NO_MORE_BIDS, document) is not None,
+            "too_many_bids": self._find_one(ProjectSelector.TOO_MANY_BIDS, document) is not None,
+        }
+        status["can_bid"] = not any(status.values())
+        return status
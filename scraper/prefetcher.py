@@ -0,0 +1,113 @@
+"""Concurrent prefetching of project pages before the bidding stage."""
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from db.models import Project
+from scraper.base import ProjectsScraperFactory
+from scraper.page import ProjectPage
+from core.config import settings
+from core.http_client import HttpClient
+from core.loggers import projects_scraper_logger as logger
+
+
+class ProjectPagePrefetcher:
+    """Fetches project pages concurrently over HTTP and parses them into ProjectPage.
+
+    Concurrency is bounded by a semaphore, and requests to the same host
+    are spaced by at least `host_delay` seconds.
+    """
+
+    def __init__(
+        self,
+        scraper: ProjectsScraperFactory,
+        http_client: HttpClient,
+        concurrency: int = settings.PREFETCH_CONCURRENCY,
+        host_delay: float = settings.PREFETCH_HOST_DELAY,
+    ):
+        """Initialize prefetcher.
+
+        Args:
+            scraper: Scraper used to parse fetched pages
+            http_client: HTTP client with browser session cookies
+            concurrency: Maximum number of requests in flight
+            host_delay: Minimum delay between requests to the same host (seconds)
+        """
+        self.scraper = scraper
+        self.http_client = http_client
+        self.concurrency = max(1, concurrency)
+        self.host_delay = host_delay
+
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._host_last_request: dict[str, float] = {}
+
+    async def _wait_for_host(self, host: str) -> None:
+        """Sleep until the politeness delay for host has passed."""
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            last_request = self._host_last_request.get(host)
+            if last_request is not None:
+                wait = self.host_delay - (time.monotonic() - last_request)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._host_last_request[host] = time.monotonic()
+
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        project: Project,
+    ) -> ProjectPage | None:
+        async with semaphore:
+            await self._wait_for_host(urlsplit(project.link).netloc)
+            try:
+                response = await client.get(project.link)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.warning(f"Failed to prefetch {project.link}: {e}")
+                return None
+
+        try:
+            return self.scraper.parse_project_page_html(project, response.text, str(response.url))
+        except Exception as e:
+            logger.warning(f"Failed to parse prefetched page {project.link}: {e}")
+            return None
+
+    async def fetch_all(self, projects: list[Project]) -> dict[int, ProjectPage]:
+        """Fetch and parse project pages concurrently.
+
+        Args:
+            projects: Projects to prefetch
+
+        Returns:
+            Dict of project id -> ProjectPage (failed projects are omitted)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self._host_locks.clear()
+        self._host_last_request.clear()
+
+        async with self.http_client.async_client(self.concurrency) as client:
+            pages = await asyncio.gather(
+                *(self._fetch_page(client, semaphore, project) for project in projects)
+            )
+
+        return {
+            project.id: page
+            for project, page in zip(projects, pages)
+            if page is not None
+        }
+
+    def prefetch(self, projects: list[Project]) -> dict[int, ProjectPage]:
+        """Synchronous wrapper around fetch_all."""
+        if not projects:
+            return {}
+
+        started = time.monotonic()
+        pages = asyncio.run(self.fetch_all(projects))
+        logger.info(
+            f"Prefetched {len(pages)}/{len(projects)} project pages "
+            f"in {time.monotonic() - started:.1f}s (concurrency={self.concurrency})"
+        )
+        return pages
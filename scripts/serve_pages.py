@@ -0,0 +1,27 @@
+"""Local stand-in server for saved marketplace pages.
+
+Serves HTML files from a directory, so HTTP fetch mode can be tried
+without hitting the real marketplace:
+
+    python -m scripts.serve_pages data/pages 8001
+
+Then point FREELANCEHUNT_PROJECTS_PAGE at e.g.
+http://127.0.0.1:8001/projects.html?x=1 and set SCRAPER_FETCH_MODE=http.
+Query string is ignored, "/projects.html?page=2" serves "projects.html".
+"""
+import sys
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+def serve(directory: str, port: int = 8001) -> None:
+    handler = partial(SimpleHTTPRequestHandler, directory=directory)
+    with ThreadingHTTPServer(("127.0.0.1", port), handler) as server:
+        print(f"Serving {directory} on http://127.0.0.1:{port}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else "."
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8001
+    serve(directory, port)
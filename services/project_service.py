@@ -1,11 +1,23 @@
 """Project service for business logic."""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator
 
+from ai.async_client import AsyncAI
 from ai.client import AI
-from ai.prompts import BASE_PROMPT
+from ai.prefilter import KeywordPreFilter
+from db.link_index import KnownLinkIndex
 from db.models import Project
 from db.repositories.project_repository import ProjectRepository
+from db.repositories.crawl_state_repository import CrawlStateRepository
+from db.repositories.project_update_buffer import ProjectUpdateBuffer
 from scraper.base import ProjectsScraperFactory
-from schemas.project import UpdateProjectSchema
+from scraper.page import ProjectPage
+from scraper.prefetcher import ProjectPagePrefetcher
+from core.browser_pool import BrowserPool
+from core.config import settings
+from schemas.project import AIVerdictEnum, CreateProjectSchema, ProjectStatusEnum, UpdateProjectSchema
+from utils.helpers import content_hash
 from core.loggers import db_logger as logger
 from core.exceptions import (
     AIResponseError,
@@ -24,9 +36,22 @@ class ProjectService:
         self, 
         repository: ProjectRepository,
         scraper: ProjectsScraperFactory,
+        prefetcher: ProjectPagePrefetcher | None = None,
+        crawl_state_repository: CrawlStateRepository | None = None,
+        link_index: KnownLinkIndex | None = None,
+        update_buffer: ProjectUpdateBuffer | None = None,
+        prefilter: KeywordPreFilter | None = None,
     ):
         self.repository = repository
         self.scraper = scraper
+        self.prefetcher = prefetcher
+        self.crawl_state_repository = crawl_state_repository
+        self.link_index = link_index
+        self.update_buffer = update_buffer
+        self.prefilter = prefilter
+        self.verdict_cache_hits = 0
+        # True if page 1 of the last crawl failed or was empty (e.g. logged out)
+        self.last_crawl_empty = False
         
     
     def scrape_and_save_projects(self, page: int) -> int:
@@ -43,21 +68,7 @@ class ProjectService:
             projects_data = self.scraper.scrape_projects_list(page)
             logger.info(f"Scraped {len(projects_data)} projects from page {page}")
             
-            # Filter out existing projects
-            new_projects = []
-            for project_data in projects_data:
-                if not self.repository.exists_by_link(project_data.link):
-                    new_projects.append(project_data)
-            
-            logger.info(f"Found {len(new_projects)} new projects (filtered {len(projects_data) - len(new_projects)} duplicates)")
-            
-            # Save to database
-            if new_projects:
-                saved = self.repository.create_many(new_projects)
-                logger.info(f"Saved {len(saved)} new projects to database")
-                return len(saved)
-            
-            return 0
+            return self.save_new_projects(projects_data)
             
         except ScrapingError as e:
             logger.error(f"Scraping error on page {page}: {e}")
@@ -66,15 +77,313 @@ class ProjectService:
             logger.error(f"Unexpected error scraping page {page}: {e}", exc_info=True)
             raise
     
+    def save_new_projects(self, projects_data: list[CreateProjectSchema]) -> int:
+        """Save projects that are not in database yet.
+        
+        Args:
+            projects_data: Scraped projects
+            
+        Returns:
+            Number of new projects saved
+        """
+        # Filter out existing projects
+        existing_links = self.get_existing_links(
+            project_data.link for project_data in projects_data
+        )
+        new_projects = [
+            project_data for project_data in projects_data
+            if project_data.link not in existing_links
+        ]
+        
+        logger.info(f"Found {len(new_projects)} new projects (filtered {len(projects_data) - len(new_projects)} duplicates)")
+        
+        # Save to database
+        if new_projects:
+            saved = self.repository.create_many(new_projects)
+            logger.info(f"Saved {len(saved)} new projects to database")
+            if self.link_index is not None:
+                # Links that lost an insert race are stored too
+                self.link_index.add(project_data.link for project_data in new_projects)
+            return len(saved)
+        
+        return 0
+    
+    def get_existing_links(self, links: Iterable[str]) -> set[str]:
+        """Get which of the given links are already stored.
+        
+        With a link index only links it cannot decide on go to the database
+        (single query for the whole page).
+        
+        Args:
+            links: Project links to check
+            
+        Returns:
+            Set of links that exist in database
+        """
+        if self.link_index is None:
+            return self.repository.get_existing_links(links)
+        
+        known, _, uncertain = self.link_index.classify(links)
+        if uncertain:
+            existing = self.repository.get_existing_links(uncertain)
+            self.link_index.record_db_result(uncertain, existing)
+            known |= existing
+        
+        logger.debug(f"Link index stats: {self.link_index.stats}")
+        return known
+    
+    def scrape_new_projects(self, max_pages: int = settings.CRAWL_MAX_PAGES) -> int:
+        """Incrementally scrape listing pages newest-first until known projects are reached.
+        
+        Stops at the first page where every project is already known, after
+        CRAWL_KNOWN_ROWS_TO_STOP consecutive known rows (if > 0), or when the
+        newest link of the previous crawl (watermark) is reached. The
+        watermark only advances when the crawl reached known projects, so
+        pages that failed or were cut off by `max_pages` are crawled again.
+        
+        Args:
+            max_pages: Upper bound on pages to load
+            
+        Returns:
+            Number of new projects saved
+        """
+        marketplace = self.scraper.marketplace_enum
+        watermark = None
+        if self.crawl_state_repository is not None:
+            watermark = self.crawl_state_repository.get_watermark(marketplace)
+        
+        known_rows_to_stop = settings.CRAWL_KNOWN_ROWS_TO_STOP
+        newest_link = None
+        total_saved = 0
+        known_run = 0
+        caught_up = False
+        self.last_crawl_empty = False
+        
+        for page in range(1, max_pages + 1):
+            try:
+                projects_data = self.scraper.scrape_projects_list(page)
+            except ScrapingError as e:
+                logger.error(f"Failed to scrape page {page}: {e}")
+                self.last_crawl_empty = page == 1
+                break
+            
+            if not projects_data:
+                logger.info(f"Page {page} is empty, stopping crawl")
+                self.last_crawl_empty = page == 1
+                break
+            
+            if newest_link is None:
+                newest_link = projects_data[0].link
+            
+            existing_links = self.get_existing_links(
+                project_data.link for project_data in projects_data
+            )
+            
+            # Take rows up to the stop point, newest first
+            page_projects = []
+            page_all_known = True
+            stop = False
+            for project_data in projects_data:
+                if project_data.link == watermark:
+                    logger.info(f"Reached watermark on page {page}")
+                    stop = True
+                    break
+                
+                if project_data.link in existing_links:
+                    known_run += 1
+                    if known_rows_to_stop and known_run >= known_rows_to_stop:
+                        logger.info(f"{known_run} known projects in a row on page {page}")
+                        stop = True
+                        break
+                else:
+                    known_run = 0
+                    page_all_known = False
+                    page_projects.append(project_data)
+            
+            if page_projects:
+                total_saved += self.save_new_projects(page_projects)
+            
+            if stop or page_all_known:
+                logger.info(f"Incremental crawl stopped at page {page}")
+                caught_up = True
+                break
+        
+        if not caught_up:
+            logger.warning(f"Crawl didn't reach known projects, keeping watermark {watermark}")
+        elif newest_link and self.crawl_state_repository is not None:
+            self.crawl_state_repository.set_watermark(marketplace, newest_link)
+        
+        return total_saved
+    
     def get_active_projects(self) -> list[Project]:
-        """Get all active projects (no bid placed, not skipped)."""
+        """Get all active projects whose next attempt is due."""
+        if self.update_buffer is not None:
+            # Projects decided on in the previous run must not come back
+            self.update_buffer.flush()
         return self.repository.get_active_projects()
     
-    def process_project(self, project: Project) -> bool:
+    def iter_claimed_project_batches(self, worker_id: str, newest_first: bool = False) -> Iterator[list[Project]]:
+        """Claim due projects batch by batch, releasing each batch once processed.
+        
+        Projects leased by other workers (`--worker` processes) are skipped,
+        so a project is never bid on by two processes at once. Batches follow
+        the id order, so projects left active for a retry aren't claimed
+        again in the same run.
+        
+        Args:
+            worker_id: Unique id of this process
+            newest_first: Claim newest projects first
+        """
+        if self.update_buffer is not None:
+            # Projects decided on in the previous run must not come back
+            self.update_buffer.flush()
+        
+        last_id = None
+        while True:
+            projects = self.repository.claim_projects(
+                worker_id,
+                self.scraper.marketplace_enum,
+                newest_first=newest_first,
+                after_id=last_id
+            )
+            if not projects:
+                return
+            
+            try:
+                yield projects
+            finally:
+                # New statuses must be stored before other workers can claim the projects
+                if self.update_buffer is not None:
+                    self.update_buffer.flush()
+                self.repository.release_projects([project.id for project in projects], worker_id)
+            
+            last_id = projects[-1].id
+    
+    def _update_project(self, project_id: int, update_data: UpdateProjectSchema) -> None:
+        """Update project now, or queue the update if write-behind buffer is configured."""
+        if self.update_buffer is not None:
+            self.update_buffer.add(project_id, update_data)
+        else:
+            self.repository.update(project_id, update_data)
+    
+    def _finish_project(self, project: Project, status: ProjectStatusEnum, **fields) -> None:
+        """Move project to a final status."""
+        self._update_project(project.id, UpdateProjectSchema(
+            status=status,
+            processed_at=datetime.now(timezone.utc),
+            **fields
+        ))
+    
+    def _schedule_retry(self, project: Project, status: ProjectStatusEnum, **fields) -> None:
+        """Keep project in the queue until next_attempt_at, with exponential backoff.
+        
+        After RETRY_MAX_ATTEMPTS attempts the project is skipped.
+        """
+        attempts = (project.attempts or 0) + 1
+        if attempts >= settings.RETRY_MAX_ATTEMPTS:
+            logger.warning(f"Giving up on {project.title} after {attempts} attempts")
+            self._finish_project(project, ProjectStatusEnum.SKIPPED, attempts=attempts, **fields)
+            return
+        
+        now = datetime.now(timezone.utc)
+        delay = settings.RETRY_DELAY * settings.RETRY_BACKOFF_FACTOR ** (attempts - 1)
+        logger.info(f"Retrying {project.title} in {delay:.0f}s (attempt {attempts})")
+        self._update_project(project.id, UpdateProjectSchema(
+            status=status,
+            attempts=attempts,
+            processed_at=now,
+            next_attempt_at=now + timedelta(seconds=delay),
+            **fields
+        ))
+    
+    def _get_cached_verdict(self, project: Project, description_hash: str) -> str | None:
+        """Get AI response given earlier for the same description (retry or reposted project).
+        
+        Returns:
+            "false" if the description was rejected, stored bid message if
+            accepted, None if it wasn't evaluated yet
+        """
+        if project.description_hash == description_hash and project.ai_verdict is not None:
+            source = project
+        else:
+            source = self.repository.get_evaluated_by_description_hash(description_hash)
+        
+        if source is None:
+            return None
+        if source.ai_verdict == AIVerdictEnum.REJECTED:
+            message = "false"
+        elif source.bid_message:
+            message = source.bid_message
+        else:
+            return None
+        
+        self.verdict_cache_hits += 1
+        logger.info(f"Reusing AI verdict of project {source.id} for {project.title} ({self.verdict_cache_hits} LLM calls saved)")
+        return message
+    
+    def prefetch_project_pages(self, projects: list[Project]) -> dict[int, ProjectPage]:
+        """Fetch pages of given projects concurrently (if prefetcher is configured).
+        
+        Args:
+            projects: Projects to prefetch
+            
+        Returns:
+            Dict of project id -> ProjectPage, empty if prefetching is disabled
+        """
+        if self.prefetcher is None:
+            return {}
+        return self.prefetcher.prefetch(projects)
+    
+    def _check_project_page(self, project: Project, page: ProjectPage | None) -> tuple[ProjectPage | None, bool]:
+        """Load project page and settle projects that can't be bid on now.
+        
+        Args:
+            project: Project to check
+            page: Prefetched project page; loaded here if None
+            
+        Returns:
+            Tuple of (page if a bid can be placed else None, True if bid is already placed)
+        """
+        # Load project page once: status, description and bid form
+        if page is None:
+            page = self.scraper.open_project_page(project)
+        status = page.status
+        
+        # Handle different statuses
+        if status["already_bid"]:
+            logger.info(f"Bid already placed on {project.title}, marking in DB")
+            self._finish_project(project, ProjectStatusEnum.BID_PLACED)
+            return None, True
+        
+        if status["no_more_bids"]:
+            logger.info(f"No more bids allowed on {project.title}, skipping")
+            self._finish_project(project, ProjectStatusEnum.SKIPPED)
+            return None, False
+        
+        if status["too_many_bids"]:
+            logger.warning(f"Too many bids on {project.title}, skipping")
+            self._finish_project(project, ProjectStatusEnum.SKIPPED)
+            return None, False
+        
+        # can_bid is set when none of the statuses above is: get project details and AI response
+        return page, False
+    
+    def _handle_project_error(self, project: Project, e: Exception) -> None:
+        if isinstance(e, (BidAlreadyPlacedError, NoMoreBidsError, TooManyBidsError)):
+            logger.info(f"Cannot bid on {project.title}: {e}")
+            self._finish_project(project, ProjectStatusEnum.SKIPPED)
+            return
+        
+        logger.error(f"Error processing project {project.title}: {e}", exc_info=True)
+        # Retry later; attempts are capped to avoid reprocessing forever
+        self._schedule_retry(project, ProjectStatusEnum.BID_FAILED)
+    
+    def process_project(self, project: Project, page: ProjectPage | None = None) -> bool:
         """Process a project - check status, get AI response, place bid if needed.
         
         Args:
             project: Project to process
+            page: Prefetched project page; loaded here if None
             
         Returns:
             True if bid was placed, False otherwise
@@ -82,106 +391,302 @@ class ProjectService:
         logger.info(f"Processing project: {project.title} ({project.link})")
         
         try:
-            # Check bid status first
-            status = self.scraper.check_bid_status(project)
-            
-            # Handle different statuses
-            if status["already_bid"]:
-                logger.info(f"Bid already placed on {project.title}, marking in DB")
-                self.repository.update(project.id, UpdateProjectSchema(is_bid_placed=True))
-                return True
-            
-            if status["no_more_bids"]:
-                logger.info(f"No more bids allowed on {project.title}, skipping")
-                self.repository.update(project.id, UpdateProjectSchema(is_bid_skipped=True))
-                return False
+            page, bid_placed = self._check_project_page(project, page)
+            if page is None:
+                return bid_placed
+            return self._process_bidding(project, page)
             
-            if status["too_many_bids"]:
-                logger.warning(f"Too many bids on {project.title}, skipping")
-                self.repository.update(project.id, UpdateProjectSchema(is_bid_skipped=True))
-                return False
+        except Exception as e:
+            self._handle_project_error(project, e)
+            return False
+    
+    def process_claimed_projects(self, worker_id: str) -> tuple[int, int]:
+        """Claim a batch of due projects, process them and release the leases.
+        
+        Safe to run in several processes against one database: claimed
+        projects are leased to this worker (see ProjectRepository.claim_projects).
+        
+        Args:
+            worker_id: Unique id of this worker
             
-            # If we can bid, get project details and AI response
-            if status["can_bid"]:
-                return self._process_bidding(project)
+        Returns:
+            Tuple of (projects claimed, bids placed); (0, 0) if the queue is empty
+        """
+        projects = self.repository.claim_projects(worker_id, self.scraper.marketplace_enum)
+        if not projects:
+            return 0, 0
+        
+        pages = self.prefetch_project_pages(projects)
+        project_ids = [project.id for project in projects]
+        bids_placed = 0
+        
+        try:
+            for index, project in enumerate(projects):
+                # Heartbeat: keep leases of the remaining projects alive
+                if index:
+                    self.repository.extend_lease(project_ids[index:], worker_id)
+                if self.process_project(project, page=pages.get(project.id)):
+                    bids_placed += 1
+        finally:
+            # New statuses must be stored before other workers can claim the projects
+            if self.update_buffer is not None:
+                self.update_buffer.flush()
+            self.repository.release_projects(project_ids, worker_id)
+        
+        return len(projects), bids_placed
+    
+    def process_projects_parallel(
+        self,
+        projects: list[Project],
+        pool: BrowserPool,
+        repository_factory: Callable[[], ProjectRepository],
+        pages: dict[int, ProjectPage] | None = None,
+    ) -> dict[int, bool]:
+        """Process projects with one worker per pooled browser.
+        
+        Each worker gets its own scraper (bound to the checked out browser)
+        and its own repository, because DB sessions are not thread-safe.
+        
+        Args:
+            projects: Projects to process
+            pool: Started BrowserPool
+            repository_factory: Creates a repository with a new DB session
+            pages: Prefetched project pages by project id
             
-            return False
+        Returns:
+            Dict of project id -> True if bid was placed
+        """
+        pages = pages or {}
+        scraper_class = type(self.scraper)
+        
+        def worker(project: Project) -> bool:
+            with pool.acquire() as browser:
+                repository = repository_factory()
+                try:
+                    service = ProjectService(
+                        repository=repository,
+                        scraper=scraper_class(browser, self.scraper.http_client),
+                        update_buffer=self.update_buffer,
+                        prefilter=self.prefilter
+                    )
+                    return service.process_project(project, page=pages.get(project.id))
+                except Exception as e:
+                    logger.error(f"Worker failed on {project.title}: {e}", exc_info=True)
+                    return False
+                finally:
+                    repository.session.close()
+        
+        logger.info(f"Processing {len(projects)} projects with {pool.size} browsers")
+        with ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix="bidder") as executor:
+            results = executor.map(worker, projects)
+            return {project.id: result for project, result in zip(projects, results)}
+    
+    def process_projects_pipelined(
+        self,
+        projects: list[Project],
+        async_ai: AsyncAI,
+        pages: dict[int, ProjectPage] | None = None,
+    ) -> dict[int, bool]:
+        """Process projects while AI answers are generated in the background.
+        
+        The browser checks project pages one by one and hands descriptions
+        to `async_ai` without waiting for the answer. Bids are submitted as
+        soon as answers arrive, in between page checks, so the browser is
+        not idle during AI calls.
+        
+        Args:
+            projects: Projects to process
+            async_ai: Started async AI client
+            pages: Prefetched project pages by project id
             
-        except (BidAlreadyPlacedError, NoMoreBidsError, TooManyBidsError) as e:
-            logger.info(f"Cannot bid on {project.title}: {e}")
-            self.repository.update(project.id, UpdateProjectSchema(is_bid_skipped=True))
-            return False
+        Returns:
+            Dict of project id -> True if bid was placed
+        """
+        pages = pages or {}
+        results = {}
+        pending: dict[Future, tuple[Project, ProjectPage, dict]] = {}
+        
+        def complete(futures: Iterable[Future]) -> None:
+            for future in futures:
+                project, page, fields = pending.pop(future)
+                try:
+                    results[project.id] = self._complete_bidding(project, page, future.result(), fields)
+                except Exception as e:
+                    self._handle_bidding_error(project, e, fields)
+                    results[project.id] = False
+        
+        for project in projects:
+            logger.info(f"Processing project: {project.title} ({project.link})")
+            results[project.id] = False
+            
+            try:
+                page, results[project.id] = self._check_project_page(project, pages.get(project.id))
+            except Exception as e:
+                self._handle_project_error(project, e)
+                continue
+            
+            if page is not None:
+                try:
+                    prepared = self._prepare_bidding(project, page)
+                except Exception as e:
+                    self._handle_bidding_error(project, e, {})
+                    prepared = None
+                
+                if prepared is not None:
+                    fields, message = prepared
+                    if message is None:
+                        logger.info(f"Getting AI response for {project.title}")
+                        future = async_ai.submit(async_ai.evaluate_project(fields["description"]))
+                    else:
+                        future = Future()
+                        future.set_result(message)
+                    pending[future] = (project, page, fields)
             
+            # Submit bids whose answers are ready before loading the next page
+            complete([future for future in pending if future.done()])
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            complete(done)
+        
+        return results
+    
+    def _prepare_bidding(self, project: Project, page: ProjectPage) -> tuple[dict, str | None] | None:
+        """Get project description and the stored AI verdict for it.
+        
+        Args:
+            project: Project to bid on
+            page: Loaded project page
+            
+        Returns:
+            Tuple of (fields to store, earlier AI message or None if AI must be asked),
+            or None if the project was skipped
+        """
+        # Description of the current page: the project may have been edited since the last attempt
+        description = page.description or ""
+        
+        if not description:
+            logger.warning(f"No description found for {project.title}, skipping")
+            self._finish_project(project, ProjectStatusEnum.SKIPPED)
+            return None
+        
+        if not page.can_open_bid_form:
+            logger.warning(f"Place bid button not found for {project.title}, skipping")
+            self._finish_project(project, ProjectStatusEnum.SKIPPED)
+            return None
+        
+        # Description and AI verdict, stored with any status update
+        fields = {"description": description, "description_hash": content_hash(description)}
+        
+        # Obvious mismatches are rejected without AI; no ai_verdict is stored,
+        # so changed keyword lists take effect for the same description
+        if self.prefilter is not None:
+            reason = self.prefilter.check(project.title, description)
+            if reason:
+                logger.info(f"Pre-filter rejected {project.title}: {reason}")
+                self._finish_project(project, ProjectStatusEnum.AI_REJECTED, **fields)
+                return None
+        
+        # Reuse AI verdict if this description was already evaluated
+        message = self._get_cached_verdict(project, fields["description_hash"])
+        
+        # Record the step reached together with the description (merged with the
+        # final status when updates are buffered)
+        status = ProjectStatusEnum.AI_PENDING if message is None else ProjectStatusEnum.DETAILS_FETCHED
+        self._update_project(project.id, UpdateProjectSchema(status=status, **fields))
+        return fields, message
+    
+    def _open_bid_form_early(self, project: Project, page: ProjectPage | None) -> None:
+        """Open bid form while the accepted bid message is still streaming."""
+        try:
+            self.scraper.open_bid_form(project, page)
         except Exception as e:
-            logger.error(f"Error processing project {project.title}: {e}", exc_info=True)
-            # Mark as skipped on any error to avoid reprocessing
-            self.repository.update(project.id, UpdateProjectSchema(is_bid_skipped=True))
+            # submit_bid opens the form again
+            logger.warning(f"Could not open bid form early for {project.title}: {e}")
+    
+    def _complete_bidding(self, project: Project, page: ProjectPage | None, message: str | None, fields: dict) -> bool:
+        """Act on AI answer: retry, reject or submit the bid.
+        
+        Args:
+            project: Project to bid on
+            page: Already loaded project page, if any
+            message: AI answer
+            fields: Fields from _prepare_bidding, stored with the status update
+            
+        Returns:
+            True if bid was placed
+        """
+        if not message:
+            logger.error(f"AI returned empty response for {project.title}")
+            # Don't mark as skipped - retry later
+            self._schedule_retry(project, ProjectStatusEnum.AI_PENDING, **fields)
+            return False
+        
+        logger.info(f"AI response for {project.title}: {message[:100]}...")
+        
+        # Check if AI decided to skip
+        if message.lower() == "false":
+            logger.info(f"AI decided to skip {project.title}")
+            self._finish_project(project, ProjectStatusEnum.AI_REJECTED, ai_verdict=AIVerdictEnum.REJECTED, **fields)
             return False
+        
+        # Keep the message for retries of the bid submission
+        fields.update(ai_verdict=AIVerdictEnum.ACCEPTED, bid_message=message)
+        
+        # Submit bid
+        logger.info(f"Submitting bid on {project.title}")
+        success = self.scraper.submit_bid(project, message, page=page)
+        
+        if success:
+            logger.info(f"Successfully placed bid on {project.title}")
+            self._finish_project(project, ProjectStatusEnum.BID_PLACED, **fields)
+            return True
+        else:
+            logger.warning(f"Failed to place bid on {project.title}")
+            self._schedule_retry(project, ProjectStatusEnum.BID_FAILED, **fields)
+            return False
+    
+    def _handle_bidding_error(self, project: Project, e: Exception, fields: dict) -> None:
+        if isinstance(e, BidSubmissionError):
+            logger.error(f"Bid submission failed for {project.title}: {e}")
+            # Don't skip - might be temporary error
+            self._schedule_retry(project, ProjectStatusEnum.BID_FAILED, **fields)
+        elif isinstance(e, AIResponseError):
+            logger.error(f"AI error for {project.title}: {e}")
+            self._schedule_retry(project, ProjectStatusEnum.AI_PENDING, **fields)
+        else:
+            logger.error(f"Unexpected error in bidding process for {project.title}: {e}", exc_info=True)
+            # Retry later; attempts are capped to avoid infinite retries
+            self._schedule_retry(project, ProjectStatusEnum.BID_FAILED, **fields)
     
-    def _process_bidding(self, project: Project) -> bool:
+    def _process_bidding(self, project: Project, page: ProjectPage) -> bool:
         """Process bidding logic with AI.
         
         Args:
             project: Project to bid on
+            page: Loaded project page
             
         Returns:
             True if bid was placed
         """
+        fields = {}
+        
         try:
-            # Get project details
-            details = self.scraper.scrape_project_details(project)
-            description = details.get("description", "")
-            
-            if not description:
-                logger.warning(f"No description found for {project.title}, skipping")
-                self.repository.update(project.id, UpdateProjectSchema(is_bid_skipped=True))
+            prepared = self._prepare_bidding(project, page)
+            if prepared is None:
                 return False
+            fields, message = prepared
             
-            # Get AI response
-            logger.info(f"Getting AI response for {project.title}")
-            prompt = BASE_PROMPT.format(project_description=description)
-            message = AI.prompt_to_ai(prompt)
-            
-            if not message:
-                logger.error(f"AI returned empty response for {project.title}")
-                # Don't mark as skipped - retry later
-                return False
-            
-            logger.info(f"AI response for {project.title}: {message[:100]}...")
-            
-            # Check if AI decided to skip
-            if message.lower() == "false":
-                logger.info(f"AI decided to skip {project.title}")
-                self.repository.update(project.id, UpdateProjectSchema(is_bid_skipped=True))
-                return False
-            
-            # Submit bid
-            logger.info(f"Submitting bid on {project.title}")
-            success = self.scraper.submit_bid(project, message)
-            
-            if success:
-                logger.info(f"Successfully placed bid on {project.title}")
-                self.repository.update(
-                    project.id, 
-                    UpdateProjectSchema(bid_message=message, is_bid_placed=True)
+            if message is None:
+                logger.info(f"Getting AI response for {project.title}")
+                message = AI.evaluate_project(
+                    fields["description"],
+                    on_accept=lambda: self._open_bid_form_early(project, page)
                 )
-                return True
-            else:
-                logger.warning(f"Failed to place bid on {project.title}")
-                return False
-            
-        except BidSubmissionError as e:
-            logger.error(f"Bid submission failed for {project.title}: {e}")
-            # Don't skip - might be temporary error
-            return False
             
-        except AIResponseError as e:
-            logger.error(f"AI error for {project.title}: {e}")
-            return False
+            return self._complete_bidding(project, page, message, fields)
             
         except Exception as e:
-            logger.error(f"Unexpected error in bidding process for {project.title}: {e}", exc_info=True)
-            # Mark as skipped to avoid infinite retries
-            self.repository.update(project.id, UpdateProjectSchema(is_bid_skipped=True))
+            self._handle_bidding_error(project, e, fields)
             return False
 
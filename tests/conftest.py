@@ -0,0 +1,35 @@
+"""Test setup: core.config requires these variables, tests never reach real services."""
+import os
+from pathlib import Path
+
+import pytest
+
+TEST_ENV = {
+    "DATABASE_URL": "sqlite:///:memory:",
+    "FREELANCEHUNT_LOGIN_PAGE": "https://freelancehunt.com/profile/login",
+    "FREELANCEHUNT_PROJECTS_PAGE": "https://freelancehunt.com/projects?skills%5B%5D=28",
+    "FREELANCEHUNT_EMAIL": "test@example.com",
+    "FREELANCEHUNT_PASSWORD": "test",
+    "FREELANCER_LOGIN_PAGE": "https://www.freelancer.com/login",
+    "FREELANCER_PROJECTS_PAGE": "https://www.freelancer.com/jobs",
+    "FREELANCER_EMAIL": "test@example.com",
+    "FREELANCER_PASSWORD": "test",
+    "CHROMEDRIVER_PATH": "chromedriver",
+    "OPENROUTER_API_KEY": "test",
+    "OPENROUTER_AI_MODEL": "test",
+    "AI_SYSTEM_CONTENT": "Language answer: Ukrainian",
+}
+
+for name, value in TEST_ENV.items():
+    os.environ.setdefault(name, value)
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def load_fixture():
+    """Read stored page HTML: load_fixture("freelancehunt/listing.html")."""
+    def load(name: str) -> str:
+        return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+    return load
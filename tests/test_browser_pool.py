@@ -0,0 +1,94 @@
+"""BrowserPool recycling when Chrome fails to start."""
+import queue
+from types import SimpleNamespace
+
+import pytest
+
+from core.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.driver = SimpleNamespace(current_url="https://freelancehunt.com/projects")
+    
+    def export_cookies(self) -> list[dict]:
+        return [{"name": "session", "value": "1"}]
+    
+    def import_cookies(self, cookies: list[dict], url: str) -> None:
+        self.cookies = cookies
+    
+    def memory_usage_mb(self) -> None:
+        return None
+    
+    def close_driver(self) -> None:
+        self.driver = None
+
+
+class FlakyFactory:
+    """Starts browsers until `failing` is set."""
+    
+    def __init__(self):
+        self.failing = False
+        self.started = 0
+    
+    def __call__(self) -> FakeBrowser:
+        if self.failing:
+            raise RuntimeError("chrome failed to start")
+        self.started += 1
+        return FakeBrowser()
+
+
+@pytest.fixture
+def factory():
+    return FlakyFactory()
+
+
+def start_pool(factory: FlakyFactory, **kwargs) -> BrowserPool:
+    pool = BrowserPool(size=1, max_memory_mb=0, browser_factory=factory, **kwargs)
+    pool.start(FakeBrowser())
+    return pool
+
+
+def test_recycling_keeps_old_browser_if_replacement_fails(factory):
+    pool = start_pool(factory, max_uses=1)
+    factory.failing = True
+    
+    with pool.acquire(timeout=1) as browser:
+        pass
+    
+    with pool.acquire(timeout=1) as again:
+        assert again is browser
+        assert again.driver is not None
+    
+    # Recycled at the first check-in after Chrome starts again
+    factory.failing = False
+    with pool.acquire(timeout=1):
+        pass
+    assert browser.driver is None
+    with pool.acquire(timeout=1) as recycled:
+        assert recycled is not browser
+
+
+def test_dead_browser_slot_fails_loudly_then_recovers(factory):
+    pool = start_pool(factory, max_uses=0)
+    factory.failing = True
+    
+    with pool.acquire(timeout=1) as browser:
+        browser.close_driver()
+    
+    # The slot is kept: checkouts raise instead of blocking forever
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="chrome failed to start"):
+            with pool.acquire(timeout=1):
+                pass
+    
+    factory.failing = False
+    with pool.acquire(timeout=1) as restarted:
+        assert restarted.driver is not None
+    assert factory.started == 2
+    
+    # Still exactly one browser in the pool
+    with pool.acquire(timeout=1):
+        with pytest.raises(queue.Empty):
+            with pool.acquire(timeout=0.1):
+                pass
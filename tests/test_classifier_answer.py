@@ -0,0 +1,23 @@
+"""Parsing of the cheap classifier's yes/no answer (AI_TWO_STAGE)."""
+import pytest
+
+from ai.client import parse_classifier_answer
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("yes", True),
+    ("Yes.", True),
+    ('"true"', True),
+    ("Так", True),
+    (" no\n", False),
+    ("False", False),
+    ("ні.", False),
+    ("The project is about WordPress", None),
+    ("Telegram bot", None),
+    ("Ye", None),
+    ("nothing", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_classifier_answer(answer, expected):
+    assert parse_classifier_answer(answer) is expected
@@ -0,0 +1,134 @@
+"""Regression tests of Freelancehunt scraping on stored HTML pages."""
+from types import SimpleNamespace
+
+import pytest
+from lxml import html as lxml_html
+from selenium.webdriver.common.by import By
+
+from core.config import settings
+from schemas.project import MarketplaceEnum
+from scraper.freelancehunt import FreelancehuntProjectsScraper
+from scraper.parser import HtmlSnapshotParser, locator_to_xpath
+
+PROJECTS_PAGE = "https://freelancehunt.com/projects?skills%5B%5D=28"
+PROJECT_URL = "https://freelancehunt.com/project/sayt-na-nextjs-dlya-kav-yarni/1500001.html"
+
+
+class StoredPagesClient:
+    """Stands in for HttpClient, serving stored HTML by URL."""
+
+    def __init__(self, pages: dict[str, str]):
+        self.pages = pages
+
+    def get(self, url: str):
+        return SimpleNamespace(text=self.pages[url], url=url)
+
+
+@pytest.fixture
+def scraper(load_fixture, monkeypatch):
+    monkeypatch.setattr(settings, "FREELANCEHUNT_PROJECTS_PAGE", PROJECTS_PAGE)
+    http_client = StoredPagesClient({
+        f"{PROJECTS_PAGE}&page=1": load_fixture("freelancehunt/listing.html"),
+        PROJECT_URL: load_fixture("freelancehunt/project.html"),
+    })
+    return FreelancehuntProjectsScraper(None, http_client)
+
+
+def test_scrape_projects_list(scraper):
+    projects = scraper.scrape_projects_list(1)
+
+    assert [(p.title, p.link, p.price, p.currency, p.bids) for p in projects] == [
+        (
+            "Сайт на Next.js для кав'ярні",
+            "https://freelancehunt.com/project/sayt-na-nextjs-dlya-kav-yarni/1500001.html",
+            12000,
+            "UAH",
+            5,
+        ),
+        (
+            "Telegram-бот для запису клієнтів",
+            "https://freelancehunt.com/project/telegram-bot-dlya-zapisu/1500002.html",
+            scraper._parse_price("")[0],
+            "UAH",
+            12,
+        ),
+        (
+            "Доробка React-додатку",
+            "https://freelancehunt.com/project/dorobka-react-dodatku/1500003.html",
+            1500,
+            "USD",
+            None,
+        ),
+    ]
+    assert all(p.marketplace == MarketplaceEnum.FREELANCEHUNT for p in projects)
+
+
+def test_scrape_project_details(scraper):
+    project = SimpleNamespace(title="Сайт на Next.js для кав'ярні", link=PROJECT_URL)
+
+    details = scraper.scrape_project_details(project)
+
+    assert details == {
+        "description": "Потрібен сайт-візитка для кав'ярні.\nМеню, контакти\nта онлайн-замовлення.",
+        "link": PROJECT_URL,
+        "title": project.title,
+    }
+
+
+def test_open_project_page(scraper):
+    project = SimpleNamespace(title="Сайт на Next.js для кав'ярні", link=PROJECT_URL)
+
+    page = scraper.open_project_page(project)
+
+    assert page.status == {"already_bid": False, "no_more_bids": False, "too_many_bids": False, "can_bid": True}
+    assert page.can_open_bid_form
+    assert not page.loaded_in_browser
+
+
+def test_parse_already_bid_page(load_fixture):
+    scraper = FreelancehuntProjectsScraper(None)
+
+    status = scraper.parse_bid_status_html(load_fixture("freelancehunt/project_already_bid.html"))
+
+    assert status["already_bid"]
+    assert not status["can_bid"]
+
+
+@pytest.mark.parametrize("locator", [
+    (By.ID, "project-description"),
+    (By.CLASS_NAME, "price"),
+    (By.NAME, "comment"),
+    (By.TAG_NAME, "a"),
+    (By.CSS_SELECTOR, "div.price"),
+])
+def test_locators_are_relative(locator):
+    assert locator_to_xpath(locator).startswith((".//", "descendant::"))
+
+
+def test_row_locators_search_inside_row(load_fixture):
+    # Like element.find_element(): a row without a price must not pick up another row's price
+    selectors = SimpleNamespace(
+        ALL_PROJECTS=(By.CSS_SELECTOR, "tbody tr"),
+        TITLE=(By.TAG_NAME, "a"),
+        PRICE=(By.CLASS_NAME, "price"),
+        BIDS=(By.TAG_NAME, "small"),
+    )
+    parser = HtmlSnapshotParser(selectors, None)
+
+    rows = parser.parse_project_rows(load_fixture("freelancehunt/listing.html"), PROJECT_URL)
+
+    assert [row["price"] for row in rows] == ["12 000 UAH", None, "1 500 USD"]
+    assert [row["bids"] for row in rows] == ["5 ставок", "12 ставок", None]
+
+
+@pytest.mark.parametrize("value", ["plain", "it's", 'say "hi"', "it's \"quoted\""])
+def test_locator_values_are_escaped(value):
+    document = lxml_html.fromstring(
+        "<div><span id='other'>no</span><span>yes</span></div>"
+    )
+    document[1].set("id", value)
+    document[1].set("name", value)
+    
+    for by in (By.ID, By.NAME):
+        matches = document.xpath(locator_to_xpath((by, value)))
+        assert [element.text for element in matches] == ["yes"]
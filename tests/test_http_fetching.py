@@ -0,0 +1,115 @@
+"""HTTP fetch mode and project page prefetching against a local server."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from core.exceptions import PageLoadError
+from core.http_client import HttpClient
+from scraper.freelancehunt import FreelancehuntProjectsScraper
+from scraper.prefetcher import ProjectPagePrefetcher
+
+
+class PagesHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1, so connections are kept alive between requests
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address[1], self.headers.get("Cookie")))
+        
+        if self.path == "/drop":
+            # Connection closed without a response
+            self.close_connection = True
+            return
+        
+        body = server.pages.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(load_fixture):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), PagesHandler)
+    httpd.requests = []
+    httpd.pages = {
+        "/projects": load_fixture("freelancehunt/listing.html"),
+        "/project/1.html": load_fixture("freelancehunt/project.html"),
+        "/project/2.html": load_fixture("freelancehunt/project_already_bid.html"),
+    }
+    httpd.base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def http_client(server):
+    client = HttpClient(cookies=[{"name": "session", "value": "abc", "domain": "127.0.0.1"}])
+    yield client
+    client.close()
+
+
+def test_pages_are_fetched_over_one_connection(server, http_client):
+    for path in ("/projects", "/project/1.html", "/project/2.html"):
+        response = http_client.get(server.base_url + path)
+        assert response.status_code == 200
+    
+    assert [path for path, _, _ in server.requests] == ["/projects", "/project/1.html", "/project/2.html"]
+    assert len({port for _, port, _ in server.requests}) == 1
+    assert all(cookie == "session=abc" for _, _, cookie in server.requests)
+
+
+def test_listing_is_scraped_over_http(server, http_client, monkeypatch):
+    scraper = FreelancehuntProjectsScraper(None, http_client)
+    monkeypatch.setattr(scraper, "get_projects_page_url", lambda page: f"{server.base_url}/projects")
+    
+    projects = scraper.scrape_projects_list(1)
+    
+    assert [project.link for project in projects] == [
+        f"{server.base_url}/project/sayt-na-nextjs-dlya-kav-yarni/1500001.html",
+        f"{server.base_url}/project/telegram-bot-dlya-zapisu/1500002.html",
+        "https://freelancehunt.com/project/dorobka-react-dodatku/1500003.html",
+    ]
+
+
+def test_http_errors_raise_page_load_error(server, http_client):
+    with pytest.raises(PageLoadError):
+        http_client.get(server.base_url + "/missing")
+
+
+def test_prefetch_skips_failed_pages(server, http_client):
+    projects = [
+        SimpleNamespace(id=project_id, title=f"Project {project_id}", link=server.base_url + path)
+        for project_id, path in enumerate(["/project/1.html", "/missing", "/drop", "/project/2.html"], start=1)
+    ]
+    prefetcher = ProjectPagePrefetcher(
+        FreelancehuntProjectsScraper(None),
+        http_client,
+        concurrency=2,
+        host_delay=0,
+    )
+    
+    pages = prefetcher.prefetch(projects)
+    
+    assert sorted(pages) == [1, 4]
+    assert pages[1].status["can_bid"] and pages[1].can_open_bid_form
+    assert not pages[1].loaded_in_browser
+    assert pages[4].status["already_bid"]
+    assert sorted(path for path, _, _ in server.requests) == ["/drop", "/missing", "/project/1.html", "/project/2.html"]
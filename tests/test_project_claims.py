@@ -0,0 +1,80 @@
+"""Leasing of the shared project queue (daemon, one-shot run and workers)."""
+import threading
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import db.models  # noqa: F401 - registers models on Base
+from db import Base
+from db.models import Project
+from db.repositories import ProjectRepository
+from schemas.project import CreateProjectSchema, MarketplaceEnum
+from services import ProjectService
+
+PROJECTS = 20
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}", connect_args={"timeout": 30})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    
+    ProjectRepository(factory()).create_many([
+        CreateProjectSchema(
+            title=f"Project {i}",
+            link=f"https://freelancehunt.com/project/{i}.html",
+            price=1000,
+            currency="UAH",
+            marketplace=MarketplaceEnum.FREELANCEHUNT,
+        )
+        for i in range(PROJECTS)
+    ])
+    yield factory
+    engine.dispose()
+
+
+def test_competing_claimers_get_disjoint_projects(session_factory):
+    start = threading.Barrier(2)
+    claimed: dict[str, list[int]] = {}
+    
+    def claimer(worker_id: str) -> None:
+        repository = ProjectRepository(session_factory())
+        ids = claimed.setdefault(worker_id, [])
+        start.wait()
+        while projects := repository.claim_projects(worker_id, MarketplaceEnum.FREELANCEHUNT, limit=3):
+            ids.extend(project.id for project in projects)
+        repository.session.close()
+    
+    threads = [threading.Thread(target=claimer, args=(worker_id,)) for worker_id in ("worker-a", "worker-b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    a, b = claimed["worker-a"], claimed["worker-b"]
+    assert not set(a) & set(b)
+    assert sorted(a + b) == list(range(1, PROJECTS + 1))
+
+
+def test_claimed_batches_skip_projects_leased_by_worker(session_factory):
+    worker = ProjectRepository(session_factory())
+    leased = {project.id for project in worker.claim_projects("worker", MarketplaceEnum.FREELANCEHUNT, limit=4)}
+    
+    repository = ProjectRepository(session_factory())
+    scraper = SimpleNamespace(marketplace_enum=MarketplaceEnum.FREELANCEHUNT, http_client=None)
+    service = ProjectService(repository=repository, scraper=scraper)
+    
+    batches = [
+        [project.id for project in projects]
+        for projects in service.iter_claimed_project_batches("daemon", newest_first=True)
+    ]
+    
+    processed = [project_id for batch in batches for project_id in batch]
+    assert processed == sorted(set(range(1, PROJECTS + 1)) - leased, reverse=True)
+    
+    # Leases are released after each batch, the worker keeps its own
+    claims = dict(repository.session.execute(select(Project.id, Project.claimed_by)).all())
+    assert {project_id for project_id, owner in claims.items() if owner} == leased
@@ -1,3 +1,6 @@
+import hashlib
+import re
+
 from bs4 import BeautifulSoup
 
 
@@ -20,4 +23,10 @@ def remove_markup(html: str) -> str:
     lines = [line.strip() for line in text.splitlines()]
     text = "\n".join([line for line in lines if line])
 
-    return text
\ No newline at end of file
+    return text
+
+
+def content_hash(text: str) -> str:
+    # хеш не залежить від пробілів і переносів рядків
+    normalized = re.sub(r"\s+", " ", text).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()